@@ -0,0 +1,262 @@
+# Description: This file contains AsyncMinHeap, an asyncio priority queue built on MinHeap. get() and put() are
+# coroutines that wait on futures while the queue is empty or full, instead of polling. Every put wakes a single
+# waiting getter per node added, so there is no thundering herd, and a waiter that is cancelled after being woken hands
+# its wakeup to the next waiter, so no node is left behind. After close(), async iteration drains the remaining nodes
+# and stops.
+
+import asyncio
+import collections
+
+from concurrent_heap import HeapEmptyException, HeapFullException
+from min_heap import *
+
+
+class HeapClosedException(MinHeapException):
+    """
+    Exception raised by AsyncMinHeap when a node is put after close(), or got after close() once it is empty.
+    """
+    pass
+
+
+class AsyncMinHeap:
+    def __init__(self, maxsize: int = 0, arity: int = 2, key=None, priority_type: str = None):
+        """
+        Initialize a new empty AsyncMinHeap holding at most maxsize nodes, or any number of nodes if maxsize is 0.
+        arity, key and priority_type are passed to the underlying MinHeap. Raises MinHeapException if maxsize is
+        negative.
+        """
+        if maxsize < 0:
+            raise MinHeapException
+        self._maxsize = maxsize
+        self._heap = MinHeap(arity=arity, key=key, priority_type=priority_type)
+        self._getters = collections.deque()
+        self._putters = collections.deque()
+        self._closed = False
+
+    def __str__(self) -> str:
+        """
+        Return AsyncMinHeap content in human-readable form
+        """
+        return "ASYNC " + str(self._heap)
+
+    def __aiter__(self):
+        """
+        Return an asynchronous iterator that gets nodes in priority order as they arrive, and stops once the
+        AsyncMinHeap is closed and empty.
+        """
+        return self
+
+    async def __anext__(self) -> object:
+        """
+        Return the next node of the asynchronous iteration.
+        """
+        try:
+            return await self.get()
+        except HeapClosedException:
+            raise StopAsyncIteration
+
+    async def put(self, node: object, priority: object = None) -> None:
+        """
+        This coroutine adds a node to the AsyncMinHeap, waiting while it is full. priority is handled as in
+        MinHeap.add(). Raises HeapClosedException if the AsyncMinHeap is closed.
+
+        Input: object, priority object
+
+        Output: None
+        """
+        while self.is_full() and not self._closed:
+            await self._wait(self._putters, self.is_full)
+        self.put_nowait(node, priority)
+
+    def put_nowait(self, node: object, priority: object = None) -> None:
+        """
+        This method adds a node to the AsyncMinHeap without waiting. Raises HeapFullException if it is full, or
+        HeapClosedException if it is closed.
+
+        Input: object, priority object
+
+        Output: None
+        """
+        if self._closed:
+            raise HeapClosedException
+        if self.is_full():
+            raise HeapFullException
+        self._heap.add(node, priority)
+        self._wake(self._getters, 1)
+
+    def put_many_nowait(self, nodes, priorities=None) -> None:
+        """
+        This method adds all nodes of an input iterable without waiting, waking at most one getter per node. priorities
+        is handled as in MinHeap.extend(). Raises HeapFullException, and adds nothing, if the nodes do not fit, or
+        HeapClosedException if the AsyncMinHeap is closed.
+
+        Input: iterable of objects, iterable of priority objects
+
+        Output: None
+        """
+        if self._closed:
+            raise HeapClosedException
+        nodes = list(nodes)
+        if self._maxsize and self._heap.size() + len(nodes) > self._maxsize:
+            raise HeapFullException
+        self._heap.extend(nodes, priorities)
+        self._wake(self._getters, len(nodes))
+
+    async def get(self) -> object:
+        """
+        This coroutine removes and returns the object with the minimum priority value, waiting while the AsyncMinHeap
+        is empty. Raises HeapClosedException if the AsyncMinHeap is closed and empty.
+
+        Input: None
+
+        Output: object
+        """
+        while self._heap.is_empty() and not self._closed:
+            await self._wait(self._getters, self._heap.is_empty)
+        return self.get_nowait()
+
+    def get_nowait(self) -> object:
+        """
+        This method removes and returns the object with the minimum priority value without waiting. Raises
+        HeapClosedException if the AsyncMinHeap is closed and empty, or HeapEmptyException if it is only empty.
+
+        Input: None
+
+        Output: object
+        """
+        if self._heap.is_empty():
+            raise HeapClosedException if self._closed else HeapEmptyException
+        node = self._heap.remove_min()
+        self._wake(self._putters, 1)
+        return node
+
+    def close(self) -> None:
+        """
+        This method closes the AsyncMinHeap. Further puts raise HeapClosedException, waiting putters are woken to
+        raise it, and getters keep receiving the remaining nodes until the AsyncMinHeap is empty.
+
+        Input: None
+
+        Output: None
+        """
+        self._closed = True
+        self._wake(self._getters, len(self._getters))
+        self._wake(self._putters, len(self._putters))
+
+    def is_closed(self) -> bool:
+        """
+        This method returns True if the AsyncMinHeap is closed, else returns False.
+
+        Input: None
+
+        Output: Boolean
+        """
+        return self._closed
+
+    def size(self) -> int:
+        """
+        This method returns the number of nodes stored in the AsyncMinHeap.
+
+        Input: None
+
+        Output: int
+        """
+        return self._heap.size()
+
+    def is_empty(self) -> bool:
+        """
+        This method returns True if the AsyncMinHeap is empty, else returns False.
+
+        Input: None
+
+        Output: Boolean
+        """
+        return self._heap.is_empty()
+
+    def is_full(self) -> bool:
+        """
+        This method returns True if the AsyncMinHeap holds maxsize nodes, else returns False.
+
+        Input: None
+
+        Output: Boolean
+        """
+        return 0 < self._maxsize <= self._heap.size()
+
+    async def _wait(self, waiters: collections.deque, blocked) -> None:
+        """
+        This helper coroutine queues a future in input waiters and waits until it is woken. If the waiting task is
+        cancelled after its future was woken, the wakeup is handed to the next waiter while blocked() is False.
+
+        Input: deque of futures, blocked function
+
+        Output: None
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                # The waiter was already woken and removed.
+                pass
+            if not waiter.cancelled() and not blocked():
+                self._wake(waiters, 1)
+            raise
+
+    def _wake(self, waiters: collections.deque, count: int) -> None:
+        """
+        This helper method wakes up to count waiters of input waiters in the order they started waiting, skipping
+        those that are already cancelled.
+
+        Input: deque of futures, count int
+
+        Output: None
+        """
+        while count > 0 and waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                count -= 1
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    async def example_1():
+        q = AsyncMinHeap()
+        q.put_many_nowait([5, 1, 3])
+        await q.put(2)
+        print(q)
+        print(await q.get(), q.get_nowait(), q.size())
+        try:
+            AsyncMinHeap(maxsize=1, key=len).put_many_nowait(['bear', 'ox'])
+        except HeapFullException as e:
+            print("Exception raised:", type(e))
+
+    async def example_2():
+        q = AsyncMinHeap(maxsize=2)
+
+        async def produce():
+            for value in [9, 4, 7, 1, 8]:
+                await q.put(value)
+            q.close()
+
+        producer = asyncio.create_task(produce())
+        print([value async for value in q])
+        await producer
+        try:
+            await q.put(3)
+        except HeapClosedException as e:
+            print("Exception raised:", type(e))
+
+    print("\n# AsyncMinHeap example 1")
+    asyncio.run(example_1())
+
+    print("\n# AsyncMinHeap example 2")
+    asyncio.run(example_2())
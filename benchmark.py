@@ -0,0 +1,867 @@
+# Description: This file contains benchmarks for the MinHeap implementation. Run it directly to print the results,
+# and pass --json to also save them as JSON, which --compare diffs against the results of an earlier version.
+# The suite benchmark times MinHeap, heapsort and DynamicArray operations against heapq and list baselines over several
+# sizes and input distributions. The arity benchmark compares binary and d-ary MinHeaps on push-heavy, balanced and
+# pop-heavy operation mixes. The numpy benchmark compares the pure-Python and NumPy engines for heapify and heapsort
+# on numeric DynamicArrays. The concurrent benchmark stresses ConcurrentMinHeap with many producer and consumer threads,
+# moving items one at a time and in batches. The async benchmark compares the per-operation overhead of AsyncMinHeap
+# and asyncio.PriorityQueue. The sharded benchmark measures the ordering quality and the throughput of ShardedMinHeap
+# in relaxed and strict mode. The parallel benchmark compares heapsort() with parallel_heapsort() on typed
+# DynamicArrays. The capacity benchmark counts the elements that DynamicArray resizes copy per operation on oscillating
+# workloads under several growth and shrink policies. The mapreduce benchmark compares the serial and parallel
+# map, filter and reduce of a CPU-heavy function with fixed and auto-tuned chunk sizes. Every benchmark returns a list
+# of result dictionaries.
+
+import argparse
+import asyncio
+import bisect
+import functools
+import heapq
+import json
+import os
+import platform
+import random
+import sys
+import threading
+import time
+
+import instrumentation
+import numpy_heap
+import parallel_array
+import parallel_sort
+from async_heap import AsyncMinHeap
+from concurrent_heap import ConcurrentMinHeap
+from min_heap import *
+from min_heap import _percolate_down
+from sharded_heap import ShardedMinHeap
+
+
+BENCHMARKS = ["suite", "arity", "numpy", "concurrent", "async", "sharded", "parallel", "capacity", "mapreduce"]
+
+# Result dictionary keys that hold measurements rather than identify the result.
+MEASUREMENTS = ("seconds", "rank_error", "copies_per_operation")
+
+DISTRIBUTIONS = ("random", "sorted", "reversed", "duplicates")
+
+# Number of insert_at_index() and remove_at_index() calls per size, since each one costs O(n).
+SHIFT_OPERATIONS = 100
+
+# Operation mixes as (name, fraction of operations that are add() calls, initial MinHeap size factor).
+# The initial size factor is relative to the number of operations, so pop-heavy mixes never run dry.
+OPERATION_MIXES = (
+    ("push-heavy", 0.9, 0.0),
+    ("balanced", 0.5, 0.5),
+    ("pop-heavy", 0.1, 1.0),
+)
+
+# DynamicArray capacity policies of the capacity benchmark as (name, constructor arguments, reserve the peak size).
+CAPACITY_POLICIES = (
+    ("default", {}, False),
+    ("lazy-shrink", {"shrink_threshold": 16, "shrink_factor": 4}, False),
+    ("never-shrink", {"auto_shrink": False}, False),
+    ("reserved", {}, True),
+)
+
+# Oscillating workloads of the capacity benchmark as (name, fraction of the peak size removed and re-added per cycle).
+OSCILLATIONS = (
+    ("drain-refill", 1.0),
+    ("deep-swing", 0.9),
+    ("shallow-swing", 0.3),
+)
+
+# Thread configurations of the concurrent benchmark as (producer threads, consumer threads).
+THREAD_COUNTS = ((1, 1), (4, 4), (16, 16), (4, 16), (16, 4))
+
+
+def make_values(size: int, distribution: str, seed: int) -> list:
+    """
+    This function returns a reproducible list of size integers with input distribution: "random", "sorted",
+    "reversed", or "duplicates" (random values drawn from only 10 distinct values).
+
+    Input: size int, distribution str, seed int
+
+    Output: list
+    """
+    rng = random.Random(f"{seed}-{size}-{distribution}")
+    if distribution == "duplicates":
+        return [rng.randrange(10) for _ in range(size)]
+    values = [rng.randrange(size * 10) for _ in range(size)]
+    if distribution == "sorted":
+        values.sort()
+    elif distribution == "reversed":
+        values.sort(reverse=True)
+    return values
+
+
+def best_time(setup, run, repeat: int) -> float:
+    """
+    This function calls run(setup()) repeat times and returns the shortest elapsed time of run in seconds. setup is
+    not timed.
+
+    Input: setup function, run function, repeat int
+
+    Output: float
+    """
+    best = None
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def suite_cases(values: list) -> list:
+    """
+    This function returns the suite benchmark cases for input values as a list of
+    (benchmark name, implementation name, setup function, run function) tuples.
+
+    Input: list
+
+    Output: list of tuples
+    """
+    size = len(values)
+    positions = [(i * 7919) % (size + 1) for i in range(SHIFT_OPERATIONS)]
+
+    def drain_minheap(h):
+        while not h.is_empty():
+            h.remove_min()
+
+    def minheap_with_handles():
+        h = MinHeap()
+        for value in values:
+            h.add(value, return_handle=True)
+        return h
+
+    def drain_heapq(heap):
+        while heap:
+            heapq.heappop(heap)
+
+    def insert_da(da):
+        for i in positions:
+            da.insert_at_index(min(i, da.length()), i)
+
+    def insert_list(lst):
+        for i in positions:
+            lst.insert(i, i)
+
+    def remove_da(da):
+        for i in positions:
+            da.remove_at_index(i % da.length())
+
+    def remove_list(lst):
+        for i in positions:
+            del lst[i % len(lst)]
+
+    def push_heapq(heap):
+        for value in values:
+            heapq.heappush(heap, value)
+
+    def append_list(lst):
+        for value in values:
+            lst.append(value)
+
+    return [
+        ("minheap.add", "MinHeap", MinHeap, lambda h: [h.add(value) for value in values]),
+        ("minheap.add", "MinHeap handles", MinHeap, lambda h: [h.add(value, return_handle=True) for value in values]),
+        ("minheap.add", "heapq", list, push_heapq),
+        ("minheap.remove_min", "MinHeap", lambda: MinHeap(values), drain_minheap),
+        ("minheap.remove_min", "MinHeap handles", minheap_with_handles, drain_minheap),
+        ("minheap.remove_min", "heapq", lambda: sorted(values), drain_heapq),
+        ("minheap.build_heap", "MinHeap", lambda: (MinHeap(), DynamicArray(values)), lambda s: s[0].build_heap(s[1])),
+        ("minheap.build_heap", "heapq", lambda: list(values), heapq.heapify),
+        ("heapsort", "heapsort", lambda: DynamicArray(values), heapsort),
+        ("heapsort", "heapsort bottom_up", lambda: DynamicArray(values),
+         functools.partial(heapsort, method="bottom_up")),
+        ("heapsort", "heapsort adaptive", lambda: DynamicArray(values), functools.partial(heapsort, method="adaptive")),
+        ("heapsort", "list.sort", lambda: list(values), lambda lst: lst.sort(reverse=True)),
+        ("dynamic_array.append", "DynamicArray", DynamicArray, lambda da: [da.append(value) for value in values]),
+        ("dynamic_array.append", "list", list, append_list),
+        ("dynamic_array.insert_at_index", "DynamicArray", lambda: DynamicArray(values), insert_da),
+        ("dynamic_array.insert_at_index", "list", lambda: list(values), insert_list),
+        ("dynamic_array.remove_at_index", "DynamicArray", lambda: DynamicArray(values), remove_da),
+        ("dynamic_array.remove_at_index", "list", lambda: list(values), remove_list),
+        ("dynamic_array.slice", "DynamicArray", lambda: DynamicArray(values), lambda da: da.slice(0, size // 2)),
+        ("dynamic_array.slice", "list", lambda: list(values), lambda lst: lst[0:size // 2]),
+        ("dynamic_array.map", "DynamicArray", lambda: DynamicArray(values), lambda da: da.map(lambda x: x * 2)),
+        ("dynamic_array.map", "list", lambda: list(values), lambda lst: [x * 2 for x in lst]),
+        ("dynamic_array.filter", "DynamicArray", lambda: DynamicArray(values), lambda da: da.filter(lambda x: x % 2)),
+        ("dynamic_array.filter", "list", lambda: list(values), lambda lst: [x for x in lst if x % 2]),
+        ("dynamic_array.reduce", "DynamicArray", lambda: DynamicArray(values),
+         lambda da: da.reduce(lambda x, y: x + y)),
+        ("dynamic_array.reduce", "list", lambda: list(values), lambda lst: functools.reduce(lambda x, y: x + y, lst)),
+        ("dynamic_array.chain", "DynamicArray", lambda: DynamicArray(values),
+         lambda da: da.map(lambda x: x * 2).filter(lambda x: x % 3).reduce(lambda x, y: x + y)),
+        ("dynamic_array.chain", "Pipeline", lambda: DynamicArray(values),
+         lambda da: da.lazy().map(lambda x: x * 2).filter(lambda x: x % 3).reduce(lambda x, y: x + y)),
+        ("dynamic_array.chain", "list", lambda: list(values),
+         lambda lst: functools.reduce(lambda x, y: x + y, [y for y in [x * 2 for x in lst] if y % 3])),
+    ]
+
+
+def bench_suite(sizes, distributions=DISTRIBUTIONS, repeat: int = 3, seed: int = 0) -> list:
+    """
+    This function times every suite benchmark case for every size and distribution and returns a list of result
+    dictionaries with keys "benchmark", "implementation", "size", "distribution" and "seconds" (best of repeat).
+
+    Input: iterable of sizes, iterable of distributions, repeat int, seed int
+
+    Output: list of dicts
+    """
+    results = []
+    for size in sizes:
+        for distribution in distributions:
+            values = make_values(size, distribution, seed)
+            for benchmark, implementation, setup, run in suite_cases(values):
+                results.append({
+                    "benchmark": benchmark,
+                    "implementation": implementation,
+                    "size": size,
+                    "distribution": distribution,
+                    "seconds": best_time(setup, run, repeat),
+                })
+    return results
+
+
+def print_suite_results(results: list) -> None:
+    """
+    This function prints the results of bench_suite() as a table.
+
+    Input: list of dicts
+
+    Output: None
+    """
+    print(f"{'benchmark':<31}{'implementation':<20}{'size':>9}  {'distribution':<12}{'seconds':>10}")
+    for row in results:
+        print(f"{row['benchmark']:<31}{row['implementation']:<20}{row['size']:>9}  {row['distribution']:<12}"
+              f"{row['seconds']:>10.5f}")
+
+
+def compare_results(old: dict, new: dict, threshold: float = 1.1) -> None:
+    """
+    This function prints every result of new whose time differs by more than a factor of threshold from the matching
+    result of old, where both are documents written by --json.
+
+    Input: old dict, new dict, threshold float
+
+    Output: None
+    """
+    for name, rows in new["results"].items():
+        old_rows = {_result_id(row): row for row in old["results"].get(name, [])}
+        for row in rows:
+            old_row = old_rows.get(_result_id(row))
+            if old_row is None or not old_row["seconds"]:
+                continue
+            ratio = row["seconds"] / old_row["seconds"]
+            if ratio > threshold or ratio < 1 / threshold:
+                label = "slower" if ratio > 1 else "faster"
+                fields = ", ".join(f"{key}={value}" for key, value in _result_id(row))
+                print(f"{name}: {fields}: {ratio:.2f}x {label}")
+
+
+def _result_id(row: dict) -> tuple:
+    """
+    This helper function returns the fields of a result dictionary that identify it between runs.
+
+    Input: dict
+
+    Output: tuple
+    """
+    return tuple((key, value) for key, value in row.items() if key not in MEASUREMENTS)
+
+
+def make_operations(count: int, push_ratio: float, seed: int) -> list:
+    """
+    This function returns a reproducible list of operations, where a number is a value to add() and None is a call
+    to remove_min().
+
+    Input: count int, push_ratio float, seed int
+
+    Output: list
+    """
+    rng = random.Random(seed)
+    return [rng.random() if rng.random() < push_ratio else None for _ in range(count)]
+
+
+def run_operations(heap: MinHeap, operations: list) -> float:
+    """
+    This function applies a list of operations to a MinHeap and returns the elapsed time in seconds. remove_min()
+    calls on an empty MinHeap are skipped.
+
+    Input: MinHeap, list of operations
+
+    Output: float
+    """
+    start = time.perf_counter()
+    for value in operations:
+        if value is not None:
+            heap.add(value)
+        elif not heap.is_empty():
+            heap.remove_min()
+    return time.perf_counter() - start
+
+
+def bench_arity(operation_count: int, arities=(2, 4, 8), seed: int = 0) -> list:
+    """
+    This function times every operation mix against every arity and returns a list of result dictionaries with keys
+    "mix", "arity" and "seconds".
+
+    Input: operation_count int, arities tuple of int, seed int
+
+    Output: list of dicts
+    """
+    results = []
+    for name, push_ratio, initial_factor in OPERATION_MIXES:
+        operations = make_operations(operation_count, push_ratio, seed)
+        rng = random.Random(seed + 1)
+        initial = [rng.random() for _ in range(int(operation_count * initial_factor))]
+        for arity in arities:
+            heap = MinHeap(initial, arity)
+            results.append({"mix": name, "arity": arity, "seconds": run_operations(heap, operations)})
+    return results
+
+
+def print_arity_results(results: list) -> None:
+    """
+    This function prints the results of bench_arity() as a table, marking the fastest arity of every mix.
+
+    Input: list of dicts
+
+    Output: None
+    """
+    print(f"{'mix':<12}{'arity':>6}{'seconds':>10}")
+    for name, _, _ in OPERATION_MIXES:
+        rows = [row for row in results if row["mix"] == name]
+        best = min(row["seconds"] for row in rows)
+        for row in rows:
+            fastest = "  <- fastest" if row["seconds"] == best else ""
+            print(f"{name:<12}{row['arity']:>6}{row['seconds']:>10.4f}{fastest}")
+
+
+def bench_numpy_engine(sizes, max_python_size: int, seed: int = 0) -> list:
+    """
+    This function times heapify and heapsort of random typed DynamicArrays with the pure-Python and NumPy engines and
+    returns a list of result dictionaries with keys "operation", "size", "engine" and "seconds". The pure-Python
+    engine is skipped for sizes above max_python_size, and the NumPy engine if NumPy is not installed, since
+    numpy_heap would only run the pure-Python engine again. Raises MinHeapException if the engines' results differ.
+
+    Input: iterable of sizes, max_python_size int, seed int
+
+    Output: list of dicts
+    """
+    results = []
+    rng = random.Random(seed)
+    for size in sizes:
+        values = [rng.random() for _ in range(size)]
+        for operation in ("heapify", "heapsort"):
+            outputs = []
+            engines = ((["numpy"] if numpy_heap.is_available() else []) +
+                       (["python"] if size <= max_python_size else []))
+            for engine in engines:
+                da = DynamicArray(values, "d")
+                start = time.perf_counter()
+                if engine == "numpy" and operation == "heapify":
+                    numpy_heap.heapify(da)
+                elif engine == "numpy":
+                    numpy_heap.heapsort(da)
+                elif operation == "heapify":
+                    for i in range((da.length() - 2) // 2, -1, -1):
+                        _percolate_down(da, i, da.length())
+                else:
+                    heapsort(da)
+                elapsed = time.perf_counter() - start
+                results.append({"operation": operation, "size": size, "engine": engine, "seconds": elapsed})
+                outputs.append(bytes(da.get_buffer()))
+            if len(set(outputs)) > 1:
+                raise MinHeapException
+    return results
+
+
+def print_numpy_results(results: list) -> None:
+    """
+    This function prints the results of bench_numpy_engine() as a table.
+
+    Input: list of dicts
+
+    Output: None
+    """
+    print(f"{'operation':<10}{'size':>10}{'engine':>8}{'seconds':>10}")
+    for row in results:
+        print(f"{row['operation']:<10}{row['size']:>10}{row['engine']:>8}{row['seconds']:>10.4f}")
+
+
+def bench_concurrent(item_count: int, thread_counts=THREAD_COUNTS, batch_sizes=(1, 64), maxsize: int = 1024,
+                     seed: int = 0) -> list:
+    """
+    This function moves item_count random values through a bounded ConcurrentMinHeap with every thread configuration
+    and batch size, and returns a list of result dictionaries with keys "producers", "consumers", "batch" and
+    "seconds". With a batch size of 1 every thread calls put() or get(), else put_many() and get_many(). Raises
+    MinHeapException if the values received differ from the values sent.
+
+    Input: item_count int, iterable of (producers, consumers) tuples, iterable of batch sizes, maxsize int, seed int
+
+    Output: list of dicts
+    """
+    rng = random.Random(seed)
+    values = [rng.random() for _ in range(item_count)]
+    results = []
+    for producers, consumers in thread_counts:
+        for batch in batch_sizes:
+            queue = ConcurrentMinHeap(maxsize)
+            received = []
+
+            def produce(part):
+                if batch == 1:
+                    for value in part:
+                        queue.put(value)
+                else:
+                    for start in range(0, len(part), batch):
+                        queue.put_many(part[start:start + batch])
+
+            def consume(count):
+                output = []
+                while count > 0:
+                    if batch == 1:
+                        output.append(queue.get())
+                        count -= 1
+                    else:
+                        nodes = queue.get_many(min(batch, count))
+                        for i in range(nodes.length()):
+                            output.append(nodes[i])
+                        count -= nodes.length()
+                received.append(output)
+
+            threads = [threading.Thread(target=produce, args=(values[i::producers],)) for i in range(producers)]
+            threads += [threading.Thread(target=consume, args=(len(range(i, item_count, consumers)),))
+                        for i in range(consumers)]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            if sorted(value for output in received for value in output) != sorted(values):
+                raise MinHeapException
+            results.append({"producers": producers, "consumers": consumers, "batch": batch, "seconds": elapsed})
+    return results
+
+
+def print_concurrent_results(results: list, item_count: int) -> None:
+    """
+    This function prints the results of bench_concurrent() as a table with the throughput of every configuration.
+
+    Input: list of dicts, item_count int
+
+    Output: None
+    """
+    print(f"{'producers':>10}{'consumers':>10}{'batch':>7}{'seconds':>10}{'items/s':>12}")
+    for row in results:
+        print(f"{row['producers']:>10}{row['consumers']:>10}{row['batch']:>7}{row['seconds']:>10.4f}"
+              f"{item_count / row['seconds']:>12.0f}")
+
+
+def bench_async(item_count: int, consumer_counts=(1, 16), seed: int = 0) -> list:
+    """
+    This function times AsyncMinHeap and asyncio.PriorityQueue moving item_count random values from one producer task
+    to every number of consumer tasks, and returns a list of result dictionaries with keys "queue", "consumers" and
+    "seconds". With 0 consumers all values are put and then got by a single task, which times the queue operations
+    without any waiting. Raises MinHeapException if the values received differ from the values sent.
+
+    Input: item_count int, iterable of consumer counts, seed int
+
+    Output: list of dicts
+    """
+    rng = random.Random(seed)
+    values = [rng.random() for _ in range(item_count)]
+    queues = {"AsyncMinHeap": lambda: AsyncMinHeap(maxsize=1024),
+              "asyncio.PriorityQueue": lambda: asyncio.PriorityQueue(maxsize=1024)}
+
+    async def sequential(queue):
+        output = []
+        for start in range(0, item_count, 1024):
+            for value in values[start:start + 1024]:
+                await queue.put(value)
+            for _ in range(len(values[start:start + 1024])):
+                output.append(await queue.get())
+        return output
+
+    async def concurrent(queue, consumers):
+        output = []
+
+        async def consume(count):
+            for _ in range(count):
+                output.append(await queue.get())
+
+        tasks = [asyncio.create_task(consume(len(range(i, item_count, consumers)))) for i in range(consumers)]
+        for value in values:
+            await queue.put(value)
+        await asyncio.gather(*tasks)
+        return output
+
+    results = []
+    for consumers in (0,) + tuple(consumer_counts):
+        for name, make_queue in queues.items():
+            queue = make_queue()
+            start = time.perf_counter()
+            if consumers == 0:
+                output = asyncio.run(sequential(queue))
+            else:
+                output = asyncio.run(concurrent(queue, consumers))
+            elapsed = time.perf_counter() - start
+            if sorted(output) != sorted(values):
+                raise MinHeapException
+            results.append({"queue": name, "consumers": consumers, "seconds": elapsed})
+    return results
+
+
+def print_async_results(results: list, item_count: int) -> None:
+    """
+    This function prints the results of bench_async() as a table with the time per item moved.
+
+    Input: list of dicts, item_count int
+
+    Output: None
+    """
+    print(f"{'queue':<24}{'consumers':>10}{'seconds':>10}{'us/item':>10}")
+    for row in results:
+        print(f"{row['queue']:<24}{row['consumers']:>10}{row['seconds']:>10.4f}"
+              f"{row['seconds'] / item_count * 1e6:>10.2f}")
+
+
+def bench_sharded(item_count: int, shard_counts=(1, 4, 16), thread_count: int = 8, seed: int = 0) -> list:
+    """
+    This function measures ShardedMinHeap in relaxed and strict mode for every number of shards, and returns a list
+    of result dictionaries with keys "shards", "mode", "rank_error" and "seconds". The rank error is the mean number
+    of nodes still stored that are smaller than the node returned by remove_min(), after adding item_count random
+    values to random shards from one thread; it is 0 for an exact priority queue. The time is taken by thread_count
+    threads each adding and then removing its share of item_count values.
+
+    Input: item_count int, iterable of shard counts, thread_count int, seed int
+
+    Output: list of dicts
+    """
+    rng = random.Random(seed)
+    values = [rng.random() for _ in range(item_count)]
+    results = []
+    for shards in shard_counts:
+        for mode in ("relaxed", "strict"):
+            heap = ShardedMinHeap(shards, mode == "strict", "random", seed=seed)
+            for value in values:
+                heap.add(value)
+            remaining = sorted(values)
+            rank_error = 0
+            for _ in range(item_count):
+                index = bisect.bisect_left(remaining, heap.remove_min())
+                rank_error += index
+                remaining.pop(index)
+
+            heap = ShardedMinHeap(shards, mode == "strict", seed=seed)
+
+            def work(part):
+                for value in part:
+                    heap.add(value)
+                for _ in part:
+                    heap.remove_min()
+
+            threads = [threading.Thread(target=work, args=(values[i::thread_count],)) for i in range(thread_count)]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            results.append({"shards": shards, "mode": mode, "rank_error": rank_error / max(item_count, 1),
+                            "seconds": elapsed})
+    return results
+
+
+def print_sharded_results(results: list, item_count: int) -> None:
+    """
+    This function prints the results of bench_sharded() as a table with the mean rank error and the throughput of
+    every configuration.
+
+    Input: list of dicts, item_count int
+
+    Output: None
+    """
+    print(f"{'shards':>7}  {'mode':<9}{'rank error':>11}{'seconds':>10}{'ops/s':>10}")
+    for row in results:
+        print(f"{row['shards']:>7}  {row['mode']:<9}{row['rank_error']:>11.2f}{row['seconds']:>10.4f}"
+              f"{2 * item_count / row['seconds']:>10.0f}")
+
+
+def bench_parallel(sizes, processes: int = None, seed: int = 0) -> list:
+    """
+    This function times heapsort() and parallel_heapsort() on random typed DynamicArrays of every size, and returns a
+    list of result dictionaries with keys "size", "sort", "processes" and "seconds". Raises MinHeapException if the
+    sorted DynamicArrays differ.
+
+    Input: iterable of sizes, processes int, seed int
+
+    Output: list of dicts
+    """
+    results = []
+    rng = random.Random(seed)
+    processes = processes or os.cpu_count() or 1
+    for size in sizes:
+        values = [rng.random() for _ in range(size)]
+        outputs = []
+        for name, workers in (("heapsort", 1), ("parallel_heapsort", processes)):
+            da = DynamicArray(values, "d")
+            start = time.perf_counter()
+            if workers == 1:
+                heapsort(da)
+            else:
+                parallel_sort.parallel_heapsort(da, workers, threshold=0)
+            elapsed = time.perf_counter() - start
+            results.append({"size": size, "sort": name, "processes": workers, "seconds": elapsed})
+            outputs.append(bytes(da.get_buffer()))
+        if len(set(outputs)) > 1:
+            raise MinHeapException
+    return results
+
+
+def print_parallel_results(results: list) -> None:
+    """
+    This function prints the results of bench_parallel() as a table with the speedup over heapsort().
+
+    Input: list of dicts
+
+    Output: None
+    """
+    print(f"{'size':>10}  {'sort':<19}{'processes':>10}{'seconds':>10}{'speedup':>9}")
+    serial = {row["size"]: row["seconds"] for row in results if row["sort"] == "heapsort"}
+    for row in results:
+        print(f"{row['size']:>10}  {row['sort']:<19}{row['processes']:>10}{row['seconds']:>10.4f}"
+              f"{serial[row['size']] / row['seconds']:>9.2f}")
+
+
+def bench_capacity(size: int, cycles: int = 20) -> list:
+    """
+    This function fills a DynamicArray to size values, then removes values from its end and appends them again for
+    a number of cycles, with every oscillating workload and capacity policy. It returns a list of result dictionaries
+    with keys "workload", "policy", "copies_per_operation" and "seconds", where copies_per_operation is the number
+    of elements copied by resizes divided by the number of appends and removes.
+
+    Input: size int, cycles int
+
+    Output: list of dicts
+    """
+    results = []
+    for workload, fraction in OSCILLATIONS:
+        swing = int(size * fraction)
+        for policy, arguments, reserve in CAPACITY_POLICIES:
+            da = DynamicArray(**arguments)
+            if reserve:
+                da.reserve(size)
+            stats = instrumentation.enable()
+            start = time.perf_counter()
+            for i in range(size):
+                da.append(i)
+            for _ in range(cycles):
+                for _ in range(swing):
+                    da.remove_at_index(da.length() - 1)
+                for i in range(swing):
+                    da.append(i)
+            elapsed = time.perf_counter() - start
+            instrumentation.disable()
+            operations = size + 2 * swing * cycles
+            results.append({"workload": workload, "policy": policy,
+                            "copies_per_operation": stats.elements_copied / operations, "seconds": elapsed})
+    return results
+
+
+def print_capacity_results(results: list) -> None:
+    """
+    This function prints the results of bench_capacity() as a table.
+
+    Input: list of dicts
+
+    Output: None
+    """
+    print(f"{'workload':<15}{'policy':<14}{'copies/op':>10}{'seconds':>10}")
+    for row in results:
+        print(f"{row['workload']:<15}{row['policy']:<14}{row['copies_per_operation']:>10.3f}{row['seconds']:>10.4f}")
+
+
+def busy_hash(value: int) -> int:
+    """
+    This function returns a hash of input value that takes a few microseconds, as a CPU-heavy map function of the
+    mapreduce benchmark.
+
+    Input: int
+
+    Output: int
+    """
+    for _ in range(50):
+        value = (value * 1103515245 + 12345) % 2147483648
+    return value
+
+
+def busy_is_odd(value: int) -> bool:
+    """
+    This function returns True if the hash of input value is odd, as a CPU-heavy filter function of the mapreduce
+    benchmark.
+
+    Input: int
+
+    Output: Boolean
+    """
+    return busy_hash(value) % 2 == 1
+
+
+def busy_max(first: int, second: int) -> int:
+    """
+    This function returns the value with the greater hash, as a CPU-heavy associative reduce function of the
+    mapreduce benchmark.
+
+    Input: int, int
+
+    Output: int
+    """
+    return first if busy_hash(first) >= busy_hash(second) else second
+
+
+def bench_mapreduce(size: int, workers: int = None, chunk_sizes=(100, 10000)) -> list:
+    """
+    This function times map, filter and reduce of CPU-heavy functions over a DynamicArray of size values, serially
+    and in parallel with every fixed chunk size and the auto-tuned chunk size, and returns a list of result
+    dictionaries with keys "operation", "chunk_size" and "seconds", where the chunk size is "serial" or "auto" for
+    those runs. Raises MinHeapException if a parallel result differs from the serial result.
+
+    Input: size int, workers int, iterable of chunk sizes
+
+    Output: list of dicts
+    """
+    workers = workers or os.cpu_count() or 1
+    da = DynamicArray(range(size))
+    operations = (
+        ("map", lambda: da.map(busy_hash), lambda chunk: parallel_array.parallel_map(
+            da, busy_hash, workers, chunk, threshold=0)),
+        ("filter", lambda: da.filter(busy_is_odd), lambda chunk: parallel_array.parallel_filter(
+            da, busy_is_odd, workers, chunk, threshold=0)),
+        ("reduce", lambda: da.reduce(busy_max), lambda chunk: parallel_array.parallel_reduce(
+            da, busy_max, workers=workers, chunk_size=chunk, threshold=0)),
+    )
+    results = []
+    for operation, serial, parallel in operations:
+        start = time.perf_counter()
+        expected = serial()
+        results.append({"operation": operation, "chunk_size": "serial", "seconds": time.perf_counter() - start})
+        for chunk_size in tuple(chunk_sizes) + (None,):
+            start = time.perf_counter()
+            output = parallel(chunk_size)
+            elapsed = time.perf_counter() - start
+            if (list(output) != list(expected)) if isinstance(output, DynamicArray) else output != expected:
+                raise MinHeapException
+            results.append({"operation": operation, "chunk_size": chunk_size or "auto", "seconds": elapsed})
+    return results
+
+
+def print_mapreduce_results(results: list) -> None:
+    """
+    This function prints the results of bench_mapreduce() as a table with the speedup over the serial run.
+
+    Input: list of dicts
+
+    Output: None
+    """
+    print(f"{'operation':<10}{'chunk size':>11}{'seconds':>10}{'speedup':>9}")
+    serial = {row["operation"]: row["seconds"] for row in results if row["chunk_size"] == "serial"}
+    for row in results:
+        print(f"{row['operation']:<10}{row['chunk_size']:>11}{row['seconds']:>10.4f}"
+              f"{serial[row['operation']] / row['seconds']:>9.2f}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="MinHeap benchmarks")
+    parser.add_argument("benchmarks", nargs="*", help=f"benchmarks to run, any of {BENCHMARKS} (default: all)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6],
+                        help="input sizes of the suite benchmark")
+    parser.add_argument("--distributions", nargs="+", default=list(DISTRIBUTIONS), choices=DISTRIBUTIONS)
+    parser.add_argument("--repeat", type=int, default=3, help="suite runs per case, the best time is kept")
+    parser.add_argument("--operations", type=int, default=100000, help="number of operations per arity mix")
+    parser.add_argument("--numpy-sizes", type=int, nargs="+", default=[10 ** 5, 10 ** 6, 10 ** 7])
+    parser.add_argument("--max-python-size", type=int, default=10 ** 5,
+                        help="largest size timed with the pure-Python engine")
+    parser.add_argument("--items", type=int, default=100000,
+                        help="number of items per concurrent, async or sharded configuration")
+    parser.add_argument("--parallel-sizes", type=int, nargs="+", default=[10 ** 5, 10 ** 6])
+    parser.add_argument("--processes", type=int, help="worker processes of parallel_heapsort (default: CPU count)")
+    parser.add_argument("--capacity-size", type=int, default=100000, help="peak size of the capacity benchmark")
+    parser.add_argument("--mapreduce-size", type=int, default=200000, help="size of the mapreduce benchmark array")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="write the results to PATH as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="compare the results with a JSON file written by --json")
+    args = parser.parse_args()
+    if not args.benchmarks:
+        args.benchmarks = BENCHMARKS
+    for name in args.benchmarks:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark {name}")
+
+    results = {}
+
+    if "suite" in args.benchmarks:
+        print(f"\n# suite benchmark - best of {args.repeat}")
+        results["suite"] = bench_suite(args.sizes, args.distributions, args.repeat, args.seed)
+        print_suite_results(results["suite"])
+
+    if "arity" in args.benchmarks:
+        print(f"\n# arity benchmark - {args.operations} operations per mix")
+        results["arity"] = bench_arity(args.operations, seed=args.seed)
+        print_arity_results(results["arity"])
+
+    if "numpy" in args.benchmarks:
+        print(f"\n# numpy engine benchmark - NumPy {'available' if numpy_heap.is_available() else 'not installed'}")
+        results["numpy"] = bench_numpy_engine(args.numpy_sizes, args.max_python_size, args.seed)
+        print_numpy_results(results["numpy"])
+
+    if "concurrent" in args.benchmarks:
+        print(f"\n# concurrent benchmark - {args.items} items per configuration")
+        results["concurrent"] = bench_concurrent(args.items, seed=args.seed)
+        print_concurrent_results(results["concurrent"], args.items)
+
+    if "async" in args.benchmarks:
+        print(f"\n# async benchmark - {args.items} items per configuration")
+        results["async"] = bench_async(args.items, seed=args.seed)
+        print_async_results(results["async"], args.items)
+
+    if "sharded" in args.benchmarks:
+        print(f"\n# sharded benchmark - {args.items} items per configuration")
+        results["sharded"] = bench_sharded(args.items, seed=args.seed)
+        print_sharded_results(results["sharded"], args.items)
+
+    if "parallel" in args.benchmarks:
+        print(f"\n# parallel benchmark - {args.processes or os.cpu_count()} processes")
+        results["parallel"] = bench_parallel(args.parallel_sizes, args.processes, args.seed)
+        print_parallel_results(results["parallel"])
+
+    if "capacity" in args.benchmarks:
+        print(f"\n# capacity benchmark - peak size {args.capacity_size}")
+        results["capacity"] = bench_capacity(args.capacity_size)
+        print_capacity_results(results["capacity"])
+
+    if "mapreduce" in args.benchmarks:
+        print(f"\n# mapreduce benchmark - {args.processes or os.cpu_count()} processes")
+        results["mapreduce"] = bench_mapreduce(args.mapreduce_size, args.processes)
+        print_mapreduce_results(results["mapreduce"])
+
+    document = {
+        "metadata": {
+            "python": sys.version,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "argv": sys.argv[1:],
+        },
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(document, file, indent=2)
+    if args.compare:
+        print(f"\n# comparison with {args.compare}")
+        with open(args.compare) as file:
+            compare_results(json.load(file), document)
@@ -0,0 +1,203 @@
+# Description: This file contains ConcurrentMinHeap, a thread-safe priority queue built on MinHeap. Producers block in
+# put() while the queue is full and consumers block in get() while it is empty, waiting on condition variables with an
+# optional timeout. put_many() and get_many() move a whole batch while taking the lock once, and the lock is only held
+# for the MinHeap operation itself.
+
+import threading
+import time
+
+from min_heap import *
+
+
+class HeapEmptyException(MinHeapException):
+    """
+    Exception raised by ConcurrentMinHeap when no node became available before the timeout.
+    """
+    pass
+
+
+class HeapFullException(MinHeapException):
+    """
+    Exception raised by ConcurrentMinHeap when no room became available before the timeout.
+    """
+    pass
+
+
+class ConcurrentMinHeap:
+    def __init__(self, maxsize: int = 0, arity: int = 2, key=None, priority_type: str = None):
+        """
+        Initialize a new empty ConcurrentMinHeap holding at most maxsize nodes, or any number of nodes if maxsize is
+        0. arity, key and priority_type are passed to the underlying MinHeap. Raises MinHeapException if maxsize is
+        negative.
+        """
+        if maxsize < 0:
+            raise MinHeapException
+        self._maxsize = maxsize
+        self._heap = MinHeap(arity=arity, key=key, priority_type=priority_type)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def __str__(self) -> str:
+        """
+        Return ConcurrentMinHeap content in human-readable form
+        """
+        with self._lock:
+            return "CONCURRENT " + str(self._heap)
+
+    def put(self, node: object, priority: object = None, block: bool = True, timeout: float = None) -> None:
+        """
+        This method adds a node to the ConcurrentMinHeap, waiting while it is full. priority is handled as in
+        MinHeap.add(). Raises HeapFullException if the ConcurrentMinHeap is still full after timeout seconds, or
+        right away if block is False.
+
+        Input: object, priority object, block Boolean, timeout float
+
+        Output: None
+        """
+        with self._not_full:
+            if self._maxsize:
+                self._wait(self._not_full, lambda: self._heap.size() < self._maxsize, block, timeout,
+                           HeapFullException)
+            self._heap.add(node, priority)
+            self._not_empty.notify()
+
+    def get(self, block: bool = True, timeout: float = None) -> object:
+        """
+        This method removes and returns the object with the minimum priority value, waiting while the
+        ConcurrentMinHeap is empty. Raises HeapEmptyException if it is still empty after timeout seconds, or right
+        away if block is False.
+
+        Input: block Boolean, timeout float
+
+        Output: object
+        """
+        with self._not_empty:
+            self._wait(self._not_empty, lambda: not self._heap.is_empty(), block, timeout, HeapEmptyException)
+            node = self._heap.remove_min()
+            self._not_full.notify()
+            return node
+
+    def put_many(self, nodes, priorities=None, timeout: float = None) -> None:
+        """
+        This method adds all nodes of an input iterable, taking the lock once for the whole batch. If the batch does
+        not fit, as many nodes as fit are added at a time while waiting for room. priorities is handled as in
+        MinHeap.extend(). Raises HeapFullException if room for the remaining nodes did not become available before
+        timeout seconds; the nodes added until then stay in the ConcurrentMinHeap.
+
+        Input: iterable of objects, iterable of priority objects, timeout float
+
+        Output: None
+        """
+        nodes = list(nodes)
+        priorities = None if priorities is None else list(priorities)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        start = 0
+        with self._not_full:
+            while start < len(nodes):
+                count = len(nodes) - start
+                if self._maxsize:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    self._wait(self._not_full, lambda: self._heap.size() < self._maxsize, True, remaining,
+                               HeapFullException)
+                    count = min(count, self._maxsize - self._heap.size())
+                self._heap.extend(nodes[start:start + count],
+                                  None if priorities is None else priorities[start:start + count])
+                self._not_empty.notify(count)
+                start += count
+
+    def get_many(self, max_count: int, block: bool = True, timeout: float = None) -> DynamicArray:
+        """
+        This method removes and returns up to max_count objects with the minimum priority values in non-descending
+        priority order, taking the lock once for the whole batch. It waits until at least one object is available.
+        Raises HeapEmptyException if the ConcurrentMinHeap is still empty after timeout seconds, or right away if
+        block is False. Raises MinHeapException if max_count is less than 1.
+
+        Input: max_count int, block Boolean, timeout float
+
+        Output: DynamicArray
+        """
+        if max_count < 1:
+            raise MinHeapException
+        with self._not_empty:
+            self._wait(self._not_empty, lambda: not self._heap.is_empty(), block, timeout, HeapEmptyException)
+            nodes = self._heap.pop_many(max_count)
+            self._not_full.notify(nodes.length())
+            return nodes
+
+    def size(self) -> int:
+        """
+        This method returns the number of nodes stored in the ConcurrentMinHeap.
+
+        Input: None
+
+        Output: int
+        """
+        with self._lock:
+            return self._heap.size()
+
+    def is_empty(self) -> bool:
+        """
+        This method returns True if the ConcurrentMinHeap is empty, else returns False.
+
+        Input: None
+
+        Output: Boolean
+        """
+        with self._lock:
+            return self._heap.is_empty()
+
+    def is_full(self) -> bool:
+        """
+        This method returns True if the ConcurrentMinHeap holds maxsize nodes, else returns False.
+
+        Input: None
+
+        Output: Boolean
+        """
+        with self._lock:
+            return 0 < self._maxsize <= self._heap.size()
+
+    def _wait(self, condition: threading.Condition, predicate, block: bool, timeout: float, exception) -> None:
+        """
+        This helper method waits on input condition, whose lock must be held, until predicate() is True. Raises input
+        exception if predicate() is still False after timeout seconds, or right away if block is False.
+
+        Input: Condition, predicate function, block Boolean, timeout float, exception class
+
+        Output: None
+        """
+        if not block:
+            if not predicate():
+                raise exception
+            return
+        if not condition.wait_for(predicate, timeout):
+            raise exception
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    print("\n# ConcurrentMinHeap example 1")
+    q = ConcurrentMinHeap(maxsize=3)
+    q.put_many([5, 1, 3])
+    print(q, q.is_full())
+    try:
+        q.put(4, timeout=0.01)
+    except HeapFullException as e:
+        print("Exception raised:", type(e))
+    print(q.get(), q.get_many(5))
+    try:
+        q.get(block=False)
+    except HeapEmptyException as e:
+        print("Exception raised:", type(e))
+
+    print("\n# ConcurrentMinHeap example 2")
+    q = ConcurrentMinHeap(maxsize=2)
+    producer = threading.Thread(target=q.put_many, args=(range(10, 0, -1),))
+    producer.start()
+    received = [q.get() for _ in range(10)]
+    producer.join()
+    print(len(received), sorted(received) == list(range(1, 11)))
@@ -1,10 +1,37 @@
 # Description: This file implements the DynamicArray data structure where the data structure's size is adjustable and
 # dynamic. It includes additional functions chunk and find_mode to complement DynamicArray. chunk sorts input
 # DynamicArray into individual DynamicArrays with values of non-descending order. find_mode returns the mode or modes
-# of input DynamicArray along with its frequency.
+# of input DynamicArray along with its frequency. A DynamicArray created with an array module typecode stores numbers in
+# a typed StaticArray of contiguous machine values. dump() and load() save a DynamicArray to a compact binary file, and
+# typed DynamicArrays can be loaded through a memory map without copying. lazy() starts a Pipeline of map and filter
+# stages that are fused into a single pass over the values when it is reduced or materialized.
+
+import functools
+import itertools
+import mmap
+import os
+import pickle
+import secrets
+import shutil
+import struct
+import sys
+from array import array
 
 from static_array import StaticArray
 
+# Header of a DynamicArray in a binary file: magic bytes, array module typecode (or a zero byte for pickled values),
+# byte order ('<' or '>'), element count and payload length in bytes. The payload follows the header and is padded
+# to a multiple of 8 bytes, so that every typed payload is aligned for its machine values.
+_HEADER = struct.Struct("<4scc2xQQ")
+_MAGIC = b"DYNA"
+_BYTE_ORDER = b"<" if sys.byteorder == "little" else b">"
+
+# Number of values buffered at a time when a stream of values is added to a DynamicArray.
+_STREAM_BLOCK = 4096
+
+# Number of values copied at a time when a DynamicArray is searched for a value.
+_SEARCH_BLOCK = 4096
+
 
 class DynamicArrayException(Exception):
     """
@@ -15,20 +42,39 @@ class DynamicArrayException(Exception):
 
 
 class DynamicArray:
-    def __init__(self, start_array=None):
+    def __init__(self, start_array=None, typecode: str = None, growth_factor: float = 2,
+                 shrink_threshold: float = 4, shrink_factor: float = 2, min_capacity: int = 10,
+                 auto_shrink: bool = True):
         """
         Initialize new dynamic array
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        If typecode is given (an array module typecode such as 'd' or 'q'),
+        values are stored as machine values in a typed StaticArray.
+        A full array grows to growth_factor times its capacity. When a value
+        is removed while size * shrink_threshold < capacity, the capacity
+        shrinks to size * shrink_factor, never below min_capacity. Since
+        shrink_factor is less than shrink_threshold, a shrunk array must lose
+        or gain a good share of its values before it is resized again.
+        If auto_shrink is False, the array never shrinks on its own.
+        Invalid factors raise DynamicArrayException
         """
+        if growth_factor <= 1 or shrink_factor < 1 or shrink_threshold <= shrink_factor or min_capacity < 1:
+            raise DynamicArrayException
         self._size = 0
         self._capacity = 4
-        self._data = StaticArray(self._capacity)
+        self._typecode = typecode
+        self._data = StaticArray(self._capacity, typecode)
+        self._growth_factor = growth_factor
+        self._shrink_threshold = shrink_threshold
+        self._shrink_factor = shrink_factor
+        self._min_capacity = min_capacity
+        self._auto_shrink = auto_shrink
+        # Capacity requested by reserve(), which automatic shrinking keeps.
+        self._reserved = 0
 
         # populate dynamic array with initial values (if provided)
-        # before using this feature, implement append() method
+        # in a single bulk load
         if start_array is not None:
-            for value in start_array:
-                self.append(value)
+            self.extend(start_array)
 
     def __str__(self) -> str:
         """
@@ -42,24 +88,54 @@ class DynamicArray:
 
     def __iter__(self):
         """
-        Create iterator for loop
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Create a new iterator for loop
+        Every loop has its own position, so nested loops over the same
+        array do not interfere. Values appended during the loop are visited.
         """
-        self._index = 0
-        return self
+        i = 0
+        while i < self._size:
+            yield self._data[i]
+            i += 1
 
-    def __next__(self):
+    def __reversed__(self):
         """
-        Obtain next value and advance iterator
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Create a new iterator over the values from last to first
         """
-        try:
-            value = self[self._index]
-        except DynamicArrayException:
-            raise StopIteration
+        for i in range(self._size - 1, -1, -1):
+            if i < self._size:
+                yield self._data[i]
 
-        self._index += 1
-        return value
+    def __len__(self) -> int:
+        """
+        Return number of elements stored in array
+        """
+        return self._size
+
+    def __contains__(self, value: object) -> bool:
+        """
+        Return True if value is stored in array / False otherwise
+        Values are searched in blocks of at most _SEARCH_BLOCK values, so
+        the array is never copied as a whole
+        """
+        for start in range(0, self._size, _SEARCH_BLOCK):
+            if value in self._data.get_range(start, min(_SEARCH_BLOCK, self._size - start)):
+                return True
+        return False
+
+    def iter_range(self, start: int, stop: int, step: int = 1):
+        """
+        Create a new iterator over the values at indices range(start, stop, step)
+        With a negative step, start must be the index of a value, or -1
+        for an empty range, as in iter_range(length - 1, -1, -1)
+        Invalid start or stop index raises DynamicArrayException
+        """
+        first, last = (0, self._size) if step > 0 else (-1, self._size - 1)
+        if step == 0 or not (first <= start <= last and -1 <= stop <= self._size):
+            raise DynamicArrayException
+        for i in range(start, stop, step):
+            if not 0 <= i < self._size:
+                return
+            yield self._data[i]
 
     def get_at_index(self, index: int) -> object:
         """
@@ -118,6 +194,115 @@ class DynamicArray:
         """
         return self._capacity
 
+    def get_typecode(self) -> str:
+        """
+        Return the array module typecode of the array, or None
+        """
+        return self._typecode
+
+    def get_buffer(self) -> memoryview:
+        """
+        Return a writable memoryview of the stored values of a typed array,
+        valid until the array is next resized
+        Untyped array raises DynamicArrayException
+        """
+        if self._typecode is None:
+            raise DynamicArrayException
+        return self._data.get_buffer()[:self._size]
+
+    def dump(self, path: str, typecode: str = None) -> None:
+        """
+        Save the values to a binary file at input path
+        Values of a typed array, or of any array if typecode is given, are
+        written as machine values of that typecode, else they are pickled,
+        so only load files from a trusted source.
+        The file is written next to path and then moved onto it, so a dump
+        that fails leaves the previous file as it was, and arrays loaded
+        from the previous file through a memory map keep their values.
+        """
+        _write_file(path, lambda file: self._dump_to(file, typecode))
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = False) -> "DynamicArray":
+        """
+        Return a new dynamic array with the values saved by dump()
+        If use_mmap is True, typed values are used in place through a
+        copy-on-write memory map of the file, which is only copied when the
+        array is resized. Changes are never written back to the file.
+        Pickled values are restored with pickle, which can run arbitrary
+        code, so never load a file from an untrusted source.
+        Invalid file raises DynamicArrayException
+        """
+        da, _ = cls._load_from(_read_buffer(path, use_mmap), 0, use_mmap)
+        return da
+
+    def _dump_to(self, file, typecode: str = None) -> None:
+        """
+        Write a header and the values to an open binary file
+        """
+        typecode = typecode or self._typecode
+        if typecode is None:
+            payload = pickle.dumps([self._data[i] for i in range(self._size)], pickle.HIGHEST_PROTOCOL)
+        elif typecode == self._typecode:
+            payload = self.get_buffer()
+        else:
+            payload = memoryview(array(typecode, [self._data[i] for i in range(self._size)]))
+        nbytes = payload.nbytes if isinstance(payload, memoryview) else len(payload)
+        file.write(_HEADER.pack(_MAGIC, (typecode or "\0").encode(), _BYTE_ORDER, self._size, nbytes))
+        file.write(payload)
+        file.write(bytes(-nbytes % 8))
+
+    @classmethod
+    def _load_from(cls, buffer, offset: int, use_mmap: bool = False) -> tuple:
+        """
+        Return a dynamic array read from a buffer at offset, and the offset
+        of the data that follows it
+        """
+        if len(buffer) < offset + _HEADER.size:
+            raise DynamicArrayException
+        magic, typecode, byte_order, count, nbytes = _HEADER.unpack_from(buffer, offset)
+        start = offset + _HEADER.size
+        end = start + nbytes
+        if magic != _MAGIC or len(buffer) < end:
+            raise DynamicArrayException
+        payload = memoryview(buffer)[start:end]
+
+        if typecode == b"\0":
+            try:
+                da = cls(pickle.loads(payload))
+            except (pickle.UnpicklingError, EOFError):
+                raise DynamicArrayException
+        else:
+            try:
+                typecode = typecode.decode()
+                itemsize = array(typecode).itemsize
+            except ValueError:
+                # Not an array module typecode, including bytes that are not ASCII.
+                raise DynamicArrayException
+            if itemsize * count != nbytes:
+                raise DynamicArrayException
+            if count == 0:
+                da = cls(typecode=typecode)
+            elif use_mmap and byte_order == _BYTE_ORDER:
+                da = cls._wrap(StaticArray.from_buffer(payload, typecode))
+            else:
+                values = array(typecode, payload.tobytes())
+                if byte_order != _BYTE_ORDER:
+                    values.byteswap()
+                da = cls._wrap(StaticArray.from_buffer(values, typecode))
+        return da, end + (-nbytes % 8)
+
+    @classmethod
+    def _wrap(cls, data: StaticArray) -> "DynamicArray":
+        """
+        Return a new dynamic array whose values are all elements of a typed
+        StaticArray, using it as storage without copying until resized
+        """
+        da = cls(typecode=data.get_typecode())
+        da._data = data
+        da._size = da._capacity = data.length()
+        return da
+
     def print_da_variables(self) -> None:
         """
         Print information contained in the dynamic array.
@@ -138,13 +323,70 @@ class DynamicArray:
         """
 
         if new_capacity > 0 and new_capacity >= self._size:
-            new_arr = StaticArray(new_capacity)
+            new_arr = StaticArray(new_capacity, self._typecode)
             if self._size > 0:
-                for i in range(self._size):
-                    new_arr[i] = self._data[i]
+                new_arr.copy_from(self._data, 0, 0, self._size)
             self._capacity = new_capacity
             self._data = new_arr
 
+    def reserve(self, capacity: int) -> None:
+        """
+        This function makes sure the DynamicArray object can hold input capacity values without resizing, resizing
+        at most once. Automatic shrinking keeps at least this capacity until shrink_to_fit() is called.
+
+        Input: capacity int
+
+        Output: None
+        """
+
+        self._reserved = capacity
+        if capacity > self._capacity:
+            self.resize(capacity)
+
+    def shrink_to_fit(self) -> None:
+        """
+        This function releases unused capacity, resizing the DynamicArray object to its size (at least 1), and
+        cancels the capacity requested by reserve().
+
+        Input: None
+
+        Output: None
+        """
+
+        self._reserved = 0
+        if self._capacity > max(self._size, 1):
+            self.resize(max(self._size, 1))
+
+    def _grow(self, required: int) -> None:
+        """
+        This helper function grows the capacity by growth_factor, as many times as needed to hold required values,
+        with a single resize.
+
+        Input: required int
+
+        Output: None
+        """
+
+        new_capacity = self._capacity
+        while new_capacity < required:
+            new_capacity = max(new_capacity + 1, int(new_capacity * self._growth_factor))
+        if new_capacity > self._capacity:
+            self.resize(new_capacity)
+
+    def _shrink(self) -> None:
+        """
+        This helper function shrinks the capacity to size * shrink_factor if size * shrink_threshold is strictly
+        less than the capacity, keeping at least min_capacity and the reserved capacity.
+
+        Input: None
+
+        Output: None
+        """
+
+        floor = max(self._min_capacity, self._reserved)
+        if self._auto_shrink and self._size * self._shrink_threshold < self._capacity and self._capacity > floor:
+            self.resize(max(int(self._size * self._shrink_factor), floor))
+
     def append(self, value: object) -> None:
         """
         This function adds a value object to the end of the DynamicArray object.
@@ -155,7 +397,7 @@ class DynamicArray:
         """
 
         if self._size == self._capacity:
-            self.resize(self._capacity * 2)
+            self._grow(self._size + 1)
         self._data[self._size] = value
         self._size += 1
 
@@ -173,20 +415,13 @@ class DynamicArray:
             raise DynamicArrayException
 
         if self._size == self._capacity:
-            self.resize(self._capacity * 2)
+            self._grow(self._size + 1)
 
-        # Edge case where value to be added is at the end of the array.
-        if index == self._size:
-            self._data[index] = value
-            self._size += 1
-        else:
-            curr = self._data[index]
-            self._data[index] = value
-            self._size += 1
-            for i in range(index + 1, self._size):
-                temp = self._data[i]
-                self._data[i] = curr
-                curr = temp
+        # Shifts the values from index to the end of the array one position right in a single block move.
+        if index < self._size:
+            self._data.copy_from(self._data, index, index + 1, self._size - index)
+        self._data[index] = value
+        self._size += 1
 
     def remove_at_index(self, index: int) -> None:
         """
@@ -201,24 +436,116 @@ class DynamicArray:
         if index < 0 or index >= self._size:
             raise DynamicArrayException
 
-        # Resizes DynamicArray capacity if size of DynamicArray is strictly less than 1/4 of its capacity.
-        if self._size * 4 < self._capacity:
-            # Condition to prevent resizing if capacity of DynamicArray is 10 or less.
-            if self._capacity > 10:
-                # Resizes the capacity of DynamicArray to twice its size.
-                if self._size * 2 > 10:
-                    self.resize(self._size * 2)
-                # Resizes DynamicArray capacity to limit at 10 if size * 2 is less than 10.
-                else:
-                    self.resize(10)
-
-        # Edge case where value to be removed is at the end of DynamicArray.
-        if index == self._size - 1:
-            self._size -= 1
+        # Resizes DynamicArray capacity if size of DynamicArray is strictly less than 1/shrink_threshold of its
+        # capacity, by default to twice its size and at least 10.
+        self._shrink()
+
+        # Shifts the values after index one position left in a single block move.
+        if index < self._size - 1:
+            self._data.copy_from(self._data, index + 1, index, self._size - index - 1)
+        self._size -= 1
+
+    def pop(self) -> object:
+        """
+        This function removes and returns the last value of the DynamicArray object, shrinking it like
+        remove_at_index(). Raises a DynamicArrayException if the DynamicArray is empty.
+
+        Input: None
+
+        Output: object
+        """
+
+        if self._size == 0:
+            raise DynamicArrayException
+        self._shrink()
+        self._size -= 1
+        return self._data[self._size]
+
+    def extend(self, values) -> None:
+        """
+        This function adds all values of an input iterable or DynamicArray to the end of the DynamicArray object,
+        resizing at most once.
+
+        Input: iterable or DynamicArray
+
+        Output: None
+        """
+
+        self.insert_many(self._size, values)
+
+    def insert_many(self, index: int, values) -> None:
+        """
+        This function inserts all values of an input iterable or DynamicArray at input index, in order, resizing at
+        most once and shifting the values after index in a single block move.
+        Raises a DynamicArrayException if index < 0 or index > size of DynamicArray object.
+
+        Input: index int, iterable or DynamicArray
+
+        Output: None
+        """
+
+        if index < 0 or index > self._size:
+            raise DynamicArrayException
+        if isinstance(values, DynamicArray):
+            source, count = values._data, values._size
+        else:
+            values = values if isinstance(values, (list, tuple)) else list(values)
+            source, count = None, len(values)
+        if count == 0:
+            return
+
+        self._grow(self._size + count)
+        if index < self._size:
+            self._data.copy_from(self._data, index, index + count, self._size - index)
+        if source is None:
+            self._data.set_range(index, values)
+        elif source is self._data:
+            # Inserting a DynamicArray into itself, whose values after index have just been moved.
+            self._data.copy_from(source, 0, index, index)
+            self._data.copy_from(source, index + count, index * 2, count - index)
         else:
-            for i in range(index, self._size - 1):
-                self._data[i] = self._data[i + 1]
-            self._size -= 1
+            self._data.copy_from(source, 0, index, count)
+        self._size += count
+
+    def remove_range(self, start: int, count: int) -> None:
+        """
+        This function removes count values starting at input start index, shifting the values after them in a
+        single block move and resizing at most once.
+        Raises a DynamicArrayException if start < 0, count < 0 or start + count > size of DynamicArray object.
+
+        Input: start int, count int
+
+        Output: None
+        """
+
+        if start < 0 or count < 0 or start + count > self._size:
+            raise DynamicArrayException
+        if count == 0:
+            return
+        if start + count < self._size:
+            self._data.copy_from(self._data, start + count, start, self._size - start - count)
+        self._size -= count
+        self._shrink()
+
+    def _extend_stream(self, values, length: int = None) -> None:
+        """
+        This helper function adds the values of an input iterable to the end of the DynamicArray object without
+        holding all of them in a list: the capacity is presized once if input length, the expected number of values,
+        is known, as extend() would, and the values are written to the storage in blocks of at most _STREAM_BLOCK
+        values.
+
+        Input: iterable, length int
+
+        Output: None
+        """
+
+        if length is not None:
+            self._grow(self._size + length)
+        values = iter(values)
+        block = list(itertools.islice(values, _STREAM_BLOCK))
+        while block:
+            self.insert_many(self._size, block)
+            block = list(itertools.islice(values, _STREAM_BLOCK))
 
     def slice(self, start_index: int, size: int) -> "DynamicArray":
         """
@@ -237,9 +564,9 @@ class DynamicArray:
 
         # Edge case where sliced DynamicArray size is 0
         if size == 0:
-            return DynamicArray()
+            return DynamicArray(typecode=self._typecode)
 
-        new_dyn_arr = DynamicArray()
+        new_dyn_arr = DynamicArray(typecode=self._typecode)
         for i in range(start_index, start_index + size):
             new_dyn_arr.append(self._data[i])
 
@@ -256,8 +583,7 @@ class DynamicArray:
         """
 
         new_dyn_arr = DynamicArray()
-        for i in range(self._size):
-            new_dyn_arr.append(map_func(self._data[i]))
+        new_dyn_arr._extend_stream(map(map_func, self), self._size)
 
         return new_dyn_arr
 
@@ -271,10 +597,8 @@ class DynamicArray:
         Output: DynamicArray object
         """
 
-        new_dyn_arr = DynamicArray()
-        for i in range(self._size):
-            if filter_func(self._data[i]):
-                new_dyn_arr.append(self._data[i])
+        new_dyn_arr = DynamicArray(typecode=self._typecode)
+        new_dyn_arr._extend_stream(filter(filter_func, self))
 
         return new_dyn_arr
 
@@ -309,6 +633,155 @@ class DynamicArray:
                     total = reduce_func(total, self._data[i])
             return total
 
+    def lazy(self) -> "Pipeline":
+        """
+        This function returns a lazy Pipeline over the values of the DynamicArray object. Chained map() and filter()
+        stages run in a single pass when the Pipeline is reduced, iterated or materialized, without intermediate
+        DynamicArrays.
+
+        Input: None
+
+        Output: Pipeline object
+        """
+
+        return Pipeline(self)
+
+
+def _write_file(path: str, write) -> None:
+    """
+    Call write with a new binary file in the directory of path, then move
+    it onto path, so that path is never left truncated or half written
+    The new file is deleted if write raises
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    temp_path = os.path.join(directory, f".{name}.{secrets.token_hex(4)}.tmp")
+    try:
+        with open(temp_path, "xb") as file:
+            write(file)
+        if os.path.exists(path):
+            shutil.copymode(path, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _read_buffer(path: str, use_mmap: bool):
+    """
+    Return the content of a binary file as a bytes object, or as a
+    copy-on-write memory map if use_mmap is True
+    """
+    with open(path, "rb") as file:
+        if use_mmap:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        return file.read()
+
+
+class Pipeline:
+    """
+    Lazy chain of map and filter stages over a DynamicArray or any other iterable. Every stage returns a new Pipeline
+    and nothing runs until the Pipeline is iterated, reduced or materialized; then every value flows through all
+    stages before the next one is read, so a chain of stages makes one pass with no intermediate arrays. The values
+    are read when the Pipeline runs, so it sees changes made to the source since it was built.
+    """
+
+    def __init__(self, source, stages: tuple = ()) -> None:
+        """
+        Initialize a new Pipeline over input source with input stages, a tuple of ("map" or "filter", function) pairs.
+        """
+        self._source = source
+        self._stages = stages
+
+    def __iter__(self):
+        """
+        Create a new iterator over the values produced by all stages
+        """
+        values = iter(self._source)
+        for kind, func in self._stages:
+            values = map(func, values) if kind == "map" else filter(func, values)
+        return values
+
+    def map(self, map_func) -> "Pipeline":
+        """
+        This function returns a new Pipeline that also applies input function map_func to every value.
+
+        Input: map_func function
+
+        Output: Pipeline object
+        """
+
+        return Pipeline(self._source, self._stages + (("map", map_func),))
+
+    def filter(self, filter_func) -> "Pipeline":
+        """
+        This function returns a new Pipeline that also drops the values for which input function filter_func does
+        not return True.
+
+        Input: filter_func function
+
+        Output: Pipeline object
+        """
+
+        return Pipeline(self._source, self._stages + (("filter", filter_func),))
+
+    def reduce(self, reduce_func, initializer=None) -> object:
+        """
+        This function runs the Pipeline and returns the values combined by input function reduce_func, as
+        DynamicArray.reduce() does, consuming the values as they are produced.
+
+        Input: reduce_func function, initializer object
+
+        Output: object
+        """
+
+        values = iter(self)
+        if initializer is None:
+            for initializer in values:
+                break
+            else:
+                return None
+        return functools.reduce(reduce_func, values, initializer)
+
+    def length_hint(self) -> int:
+        """
+        This function returns the number of values the Pipeline produces if it is known without running it, which
+        is when it has no filter stage and its source has a length, else returns None.
+
+        Input: None
+
+        Output: int
+        """
+
+        if any(kind == "filter" for kind, _ in self._stages):
+            return None
+        if isinstance(self._source, DynamicArray):
+            return self._source.length()
+        try:
+            return len(self._source)
+        except TypeError:
+            return None
+
+    def to_dynamic_array(self, typecode: str = None) -> DynamicArray:
+        """
+        This function runs the Pipeline and returns its values in a new DynamicArray object of input typecode. The
+        values are written to the DynamicArray in bounded blocks as they are produced, without an intermediate list
+        of all of them, and the DynamicArray is presized when the number of values is known.
+
+        Input: typecode str
+
+        Output: DynamicArray object
+        """
+
+        new_dyn_arr = DynamicArray(typecode=typecode)
+        length = self.length_hint()
+        if length is not None and length > new_dyn_arr.get_capacity():
+            new_dyn_arr.resize(length)
+        new_dyn_arr._extend_stream(self)
+        return new_dyn_arr
+
 
 def chunk(arr: DynamicArray) -> "DynamicArray":
     """
@@ -440,6 +913,58 @@ if __name__ == "__main__":
         da.append(i + 101)
         print(da)
 
+    print("\n# typed DynamicArray - example 1")
+    da = DynamicArray([1.5, 2.5, 3.5, 4.5, 5.5], 'd')
+    print(da, da.get_typecode())
+    da.print_da_variables()
+    print(da.filter(lambda x: x > 2), da.slice(1, 2).get_typecode())
+
+    print("\n# capacity control - example 1")
+    da = DynamicArray(growth_factor=1.5, auto_shrink=False)
+    da.reserve(100)
+    for i in range(101):
+        da.append(i)
+    print(da.length(), da.get_capacity())
+    for _ in range(95):
+        da.remove_at_index(da.length() - 1)
+    print(da.length(), da.get_capacity())
+    da.shrink_to_fit()
+    print(da)
+
+    print("\n# iteration - example 1")
+    da = DynamicArray([1, 2, 3])
+    print([(a, b) for a in da for b in da if a < b])
+    print(list(reversed(da)), list(da.iter_range(0, 3, 2)), len(da), 2 in da, 4 in da)
+
+    print("\n# lazy pipeline - example 1")
+    da = DynamicArray(range(1, 11))
+    pipeline = da.lazy().map(lambda x: x * x).filter(lambda x: x % 2 == 1)
+    print(pipeline.reduce(lambda x, y: x + y), pipeline.to_dynamic_array('q'))
+    print(da.lazy().map(str).to_dynamic_array(), da.lazy().filter(lambda x: x > 10).reduce(max))
+
+    print("\n# bulk mutation - example 1")
+    da = DynamicArray([1, 2, 3])
+    da.extend(range(4, 8))
+    da.insert_many(1, ['a', 'b'])
+    print(da)
+    da.remove_range(2, 4)
+    print(da)
+    print(da.pop(), da)
+
+    print("\n# dump / load - example 1")
+    import os
+    import tempfile
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "da.bin")
+        DynamicArray([1.5, 2.5, 3.5, 4.5, 5.5], 'd').dump(path)
+        mapped = DynamicArray.load(path, use_mmap=True)
+        mapped[0] = 0.5
+        print(mapped, DynamicArray.load(path))
+        mapped.append(6.5)
+        print(mapped)
+        DynamicArray(['This', 'is', 'a', 'sentence']).dump(path)
+        print(DynamicArray.load(path))
+
     print("\n# append - example 3")
     da = DynamicArray()
     for i in range(600):
@@ -0,0 +1,226 @@
+# Description: This file contains an external sort for data that does not fit in memory. external_sort() reads its
+# input once, forming sorted runs with replacement selection in a MinHeap that holds at most memory_budget values; on
+# random input the runs are about twice as long as the budget. Runs are spilled to temporary files in a compact binary
+# format with buffered sequential writes, then streamed back with buffered sequential reads through a heap-based k-way
+# merge. Numbers of an array module typecode are stored as raw machine values, other values as pickled blocks.
+
+import os
+import pickle
+import tempfile
+from array import array
+
+from merge import merge, priority_key
+from min_heap import *
+
+# Number of values written or read per block of a run file.
+BLOCK_SIZE = 4096
+
+# Maximum number of run files merged at once. More runs are merged in several passes.
+MAX_FAN_IN = 64
+
+
+def external_sort(iterable, memory_budget: int, key=None, reverse: bool = False, typecode: str = None,
+                  temp_dir: str = None, block_size: int = BLOCK_SIZE, max_fan_in: int = MAX_FAN_IN):
+    """
+    This generator function yields the values of an input iterable or DynamicArray in non-descending order, or in
+    non-ascending order if reverse is True, holding at most memory_budget values in memory while forming runs. If key
+    is provided, values are ordered by key(value). If typecode is provided, values are numbers stored in run files as
+    machine values of that array module typecode, else they are pickled. Run files are created in temp_dir (or the
+    system default) and deleted when the generator finishes or is closed. Raises MinHeapException if memory_budget,
+    block_size is less than 1 or max_fan_in is less than 2.
+
+    Input: iterable or DynamicArray, memory_budget int, key function, reverse Boolean, typecode str, temp_dir str,
+           block_size int, max_fan_in int
+
+    Output: generator of objects
+    """
+    if memory_budget < 1 or block_size < 1 or max_fan_in < 2:
+        raise MinHeapException
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        runs = _write_runs(iter(iterable), memory_budget, key, reverse, typecode, directory, block_size)
+
+        # Merges groups of runs into longer runs until they can all be merged at once.
+        while len(runs) > max_fan_in:
+            merged_runs = []
+            for start in range(0, len(runs), max_fan_in):
+                group = runs[start:start + max_fan_in]
+                readers = [_read_run(path, typecode, block_size) for path in group]
+                path = os.path.join(directory, f"run-{len(runs)}-{start}.bin")
+                _write_run(path, merge(*readers, key=key, reverse=reverse), typecode, block_size)
+                for old_path in group:
+                    os.remove(old_path)
+                merged_runs.append(path)
+            runs = merged_runs
+
+        readers = [_read_run(path, typecode, block_size) for path in runs]
+        yield from merge(*readers, key=key, reverse=reverse)
+
+
+def _write_runs(values, memory_budget: int, key, reverse: bool, typecode: str, directory: str,
+                block_size: int) -> list:
+    """
+    This helper function splits input values into sorted run files with replacement selection and returns their
+    paths in order. A value that sorts before the last value written to the current run cannot extend it, so it is
+    tagged for the next run; the MinHeap orders values by (run number, priority value), so the current run is
+    finished before the next one starts.
+
+    Input: iterator, memory_budget int, key function, reverse Boolean, typecode str, directory str, block_size int
+
+    Output: list of str
+    """
+    # MinHeap nodes are (run number, priority value, sequence number, value) tuples. The unique sequence number stops
+    # tuple comparison before it reaches the value.
+    heap = MinHeap()
+    sequence = 0
+    for value in values:
+        heap.add((0, priority_key(value, key, reverse), sequence, value))
+        sequence += 1
+        if heap.size() == memory_budget:
+            break
+
+    paths = []
+    writer = None
+    current_run = -1
+    try:
+        while not heap.is_empty():
+            run, priority, _, value = heap.get_min()
+            if run != current_run:
+                if writer is not None:
+                    writer.close()
+                current_run = run
+                paths.append(os.path.join(directory, f"run-{run}.bin"))
+                writer = _RunWriter(paths[-1], typecode, block_size)
+            writer.write(value)
+
+            # Replaces the value just written by the next input value, with a single percolation.
+            for next_value in values:
+                next_priority = priority_key(next_value, key, reverse)
+                next_run = current_run + 1 if next_priority < priority else current_run
+                heap.replace((next_run, next_priority, sequence, next_value))
+                sequence += 1
+                break
+            else:
+                heap.remove_min()
+    finally:
+        if writer is not None:
+            writer.close()
+    return paths
+
+
+def _write_run(path: str, values, typecode: str, block_size: int) -> None:
+    """
+    This helper function writes all input values, which must already be sorted, to a run file.
+
+    Input: path str, iterable of objects, typecode str, block_size int
+
+    Output: None
+    """
+    writer = _RunWriter(path, typecode, block_size)
+    try:
+        for value in values:
+            writer.write(value)
+    finally:
+        writer.close()
+
+
+class _RunWriter:
+    """
+    Buffered sequential writer of a run file. Values are collected into blocks of block_size values, and every block
+    is written as raw machine values of typecode, or as one pickled list if typecode is None.
+    """
+
+    def __init__(self, path: str, typecode: str, block_size: int) -> None:
+        """
+        Initialize a new _RunWriter that creates the run file at input path.
+        """
+        self._file = open(path, "wb")
+        self._typecode = typecode
+        self._block_size = block_size
+        self._block = array(typecode) if typecode is not None else []
+
+    def write(self, value: object) -> None:
+        """
+        This method adds a value to the run, writing the current block when it is full.
+
+        Input: object
+
+        Output: None
+        """
+        self._block.append(value)
+        if len(self._block) == self._block_size:
+            self._flush()
+
+    def close(self) -> None:
+        """
+        This method writes the last partial block and closes the run file.
+
+        Input: None
+
+        Output: None
+        """
+        if not self._file.closed:
+            self._flush()
+            self._file.close()
+
+    def _flush(self) -> None:
+        """
+        This helper method writes the current block to the run file and starts a new block.
+
+        Input: None
+
+        Output: None
+        """
+        if not self._block:
+            return
+        if self._typecode is not None:
+            self._block.tofile(self._file)
+            self._block = array(self._typecode)
+        else:
+            pickle.dump(self._block, self._file, pickle.HIGHEST_PROTOCOL)
+            self._block = []
+
+
+def _read_run(path: str, typecode: str, block_size: int):
+    """
+    This helper generator function yields the values of a run file written by _RunWriter, reading one block at a
+    time.
+
+    Input: path str, typecode str, block_size int
+
+    Output: generator of objects
+    """
+    with open(path, "rb") as file:
+        while True:
+            if typecode is not None:
+                block = array(typecode)
+                try:
+                    block.fromfile(file, block_size)
+                except EOFError:
+                    # fromfile() keeps the values read before the end of the file.
+                    pass
+            else:
+                try:
+                    block = pickle.load(file)
+                except EOFError:
+                    return
+            if not block:
+                return
+            yield from block
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    import random
+
+    print("\n# external_sort example 1")
+    values = [random.randrange(1000) for _ in range(50)]
+    print(list(external_sort(values, memory_budget=8)))
+    print(list(external_sort(DynamicArray(values), memory_budget=8, reverse=True, typecode='q'))[:10])
+
+    print("\n# external_sort example 2")
+    words = ['monkey', 'zebra', 'elephant', 'horse', 'bear', 'ox', 'giraffe']
+    print(list(external_sort(words, memory_budget=2, key=len, max_fan_in=2)))
@@ -0,0 +1,454 @@
+# Description: This file contains an optional instrumentation layer for MinHeap, heapsort and DynamicArray. While it is
+# enabled, it counts comparisons, swaps and levels traversed by every percolation, DynamicArray.resize() calls and the
+# elements they copy, and records a latency histogram per operation. enable() replaces the instrumented methods and
+# functions with counting wrappers and disable() puts the originals back, so instrumentation costs nothing when off.
+#
+# Percolations move nodes through a hole instead of swapping them. Every level a node or hole moves is counted as one
+# swap, which is the number of swaps the swap-based algorithm performs. heapsort() latency is only recorded for calls
+# made through the min_heap module attribute (min_heap.heapsort), but its counters are recorded for every call.
+# Every wrapper binds the current HeapStats when it is entered, so disable() is safe while other threads are inside
+# instrumented calls: a call that started while enabled is counted in the HeapStats that disable() returns.
+
+import functools
+import inspect
+import time
+
+import min_heap
+from min_heap import *
+
+# Public MinHeap methods whose latency is recorded.
+MINHEAP_OPERATIONS = ("add", "remove_min", "decrease_key", "increase_key", "remove", "push_pop", "replace",
+                      "pop_many", "drain_until", "extend", "build_heap")
+
+_stats = None
+_callback = None
+_originals = []
+
+
+class LatencyHistogram:
+    """
+    Histogram of operation latencies in power of two nanosecond buckets. The bucket with upper bound 2 ** b counts the
+    latencies of at least 2 ** (b - 1) and less than 2 ** b nanoseconds.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize a new empty LatencyHistogram.
+        """
+        self._count = 0
+        self._total_ns = 0
+        self._max_ns = 0
+        self._buckets = {}
+
+    def record(self, elapsed_ns: int) -> None:
+        """
+        This method adds one latency to the LatencyHistogram.
+
+        Input: elapsed_ns int
+
+        Output: None
+        """
+        self._count += 1
+        self._total_ns += elapsed_ns
+        self._max_ns = max(self._max_ns, elapsed_ns)
+        bucket = 1 << elapsed_ns.bit_length()
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+    def snapshot(self) -> dict:
+        """
+        This method returns the content of the LatencyHistogram as a new dictionary with keys "count", "total_ns",
+        "max_ns" and "buckets", which maps every bucket upper bound in nanoseconds to its count.
+
+        Input: None
+
+        Output: dict
+        """
+        return {
+            "count": self._count,
+            "total_ns": self._total_ns,
+            "max_ns": self._max_ns,
+            "buckets": dict(sorted(self._buckets.items())),
+        }
+
+
+class HeapStats:
+    """
+    Counters and latency histograms collected while instrumentation is enabled.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize new HeapStats with all counters at 0.
+        """
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        This method sets all counters to 0 and empties all latency histograms.
+
+        Input: None
+
+        Output: None
+        """
+        self.comparisons = 0
+        self.swaps = 0
+        self.levels = 0
+        self.resize_calls = 0
+        self.elements_copied = 0
+        self._latency = {}
+
+    def record_latency(self, operation: str, elapsed_ns: int) -> None:
+        """
+        This method adds one latency to the histogram of input operation.
+
+        Input: operation str, elapsed_ns int
+
+        Output: None
+        """
+        histogram = self._latency.get(operation)
+        if histogram is None:
+            histogram = self._latency[operation] = LatencyHistogram()
+        histogram.record(elapsed_ns)
+
+    def snapshot(self) -> dict:
+        """
+        This method returns the counters and latency histograms as a new dictionary that can be exported as JSON.
+
+        Input: None
+
+        Output: dict
+        """
+        return {
+            "comparisons": self.comparisons,
+            "swaps": self.swaps,
+            "levels": self.levels,
+            "resize_calls": self.resize_calls,
+            "elements_copied": self.elements_copied,
+            "latency": {operation: histogram.snapshot() for operation, histogram in sorted(self._latency.items())},
+        }
+
+
+def enable(callback=None) -> HeapStats:
+    """
+    This function enables instrumentation and returns the HeapStats that collect the results. If callback is
+    provided, it is called as callback(operation, elapsed_ns, stats) after every timed operation, for example to
+    export the numbers to a metrics pipeline. If instrumentation is already enabled, only the callback is replaced.
+
+    Input: callback function
+
+    Output: HeapStats
+    """
+    global _stats, _callback
+    _callback = callback
+    if _stats is not None:
+        return _stats
+    _stats = HeapStats()
+
+    for name in MINHEAP_OPERATIONS:
+        if hasattr(MinHeap, name):
+            _patch(MinHeap, name, _timed(name, getattr(MinHeap, name)))
+    _patch(MinHeap, "_percolate_up", _counted_percolate_up(MinHeap._percolate_up))
+    _patch(MinHeap, "_percolate_down", _counted_percolate_down(MinHeap._percolate_down))
+    _patch(DynamicArray, "resize", _counted_resize(DynamicArray.resize))
+    _patch(min_heap, "heapsort", _timed("heapsort", _counted_heapsort(min_heap.heapsort)))
+    _patch(min_heap, "_percolate_down", _counted_helper(min_heap._percolate_down, _percolation_levels))
+    _patch(min_heap, "_percolate_down_bottom_up", _counted_helper(min_heap._percolate_down_bottom_up,
+                                                                  _percolation_levels))
+    _patch(min_heap, "_smoothsort", _counted_helper(min_heap._smoothsort, _smoothsort_swaps))
+    return _stats
+
+
+def disable() -> HeapStats:
+    """
+    This function disables instrumentation, restores the original methods and functions, and returns the HeapStats
+    collected while it was enabled, or None if it was not enabled.
+
+    Input: None
+
+    Output: HeapStats
+    """
+    global _stats, _callback
+    while _originals:
+        owner, name, original = _originals.pop()
+        setattr(owner, name, original)
+    stats, _stats, _callback = _stats, None, None
+    return stats
+
+
+def is_enabled() -> bool:
+    """
+    This function returns True if instrumentation is enabled, else returns False.
+
+    Input: None
+
+    Output: Boolean
+    """
+    return _stats is not None
+
+
+def snapshot() -> dict:
+    """
+    This function returns a snapshot of the current HeapStats as a dictionary. Raises MinHeapException if
+    instrumentation is not enabled.
+
+    Input: None
+
+    Output: dict
+    """
+    stats = _stats
+    if stats is None:
+        raise MinHeapException
+    return stats.snapshot()
+
+
+def _patch(owner, name: str, replacement) -> None:
+    """
+    This helper function replaces an attribute of a class or module and remembers the original for disable().
+
+    Input: class or module, name str, replacement object
+
+    Output: None
+    """
+    _originals.append((owner, name, owner.__dict__[name]))
+    setattr(owner, name, replacement)
+
+
+def _timed(operation: str, function):
+    """
+    This helper function returns a wrapper of input function that records its latency under input operation name.
+
+    Input: operation str, function
+
+    Output: function
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        stats, callback = _stats, _callback
+        start = time.perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed_ns = time.perf_counter_ns() - start
+            if stats is not None:
+                stats.record_latency(operation, elapsed_ns)
+                if callback is not None:
+                    callback(operation, elapsed_ns, stats)
+    return wrapper
+
+
+def _levels_between(arity: int, top: int, bottom: int) -> int:
+    """
+    This helper function returns the number of levels between an index and one of its descendants.
+
+    Input: arity int, top index int, bottom index int
+
+    Output: int
+    """
+    levels = 0
+    while bottom > top:
+        bottom = (bottom - 1) // arity
+        levels += 1
+    return levels
+
+
+def _counted_percolate_up(method):
+    """
+    This helper function returns a wrapper of MinHeap._percolate_up() that derives its comparisons and levels from
+    the start and final index of the node: one comparison per level moved, plus one with the parent that stopped it.
+
+    Input: method
+
+    Output: method
+    """
+    @functools.wraps(method)
+    def wrapper(self, index):
+        stats = _stats
+        final = method(self, index)
+        if stats is None:
+            return final
+        levels = _levels_between(self._arity, final, index)
+        stats.comparisons += levels + (1 if final > 0 else 0)
+        stats.swaps += levels
+        stats.levels += levels
+        return final
+    return wrapper
+
+
+def _counted_percolate_down(method):
+    """
+    This helper function returns a wrapper of MinHeap._percolate_down() that derives its comparisons and levels from
+    the start and final index of the node: every node on the path compares all of its children.
+
+    Input: method
+
+    Output: method
+    """
+    @functools.wraps(method)
+    def wrapper(self, index, stop):
+        stats = _stats
+        final = method(self, index, stop)
+        if stats is None:
+            return final
+        arity = self._arity
+        levels = comparisons = 0
+        node = final
+        while True:
+            comparisons += max(0, min(arity, stop - arity * node - 1))
+            if node <= index:
+                break
+            node = (node - 1) // arity
+            levels += 1
+        stats.comparisons += comparisons
+        stats.swaps += levels
+        stats.levels += levels
+        return final
+    return wrapper
+
+
+def _counted_helper(function, moves):
+    """
+    This helper function returns a wrapper of a heapsort helper function, which returns its comparisons. The
+    DynamicArray it sorts is passed through a _CountingArray, and moves(writes) returns the levels (or swaps) of the
+    call from the number of values written to it, so the helper itself counts nothing but comparisons.
+
+    Input: function, moves function
+
+    Output: function
+    """
+    @functools.wraps(function)
+    def wrapper(da, *args, **kwargs):
+        stats = _stats
+        if stats is None:
+            return function(da, *args, **kwargs)
+        counting = _CountingArray(da)
+        comparisons = function(counting, *args, **kwargs)
+        levels = moves(counting.writes)
+        stats.comparisons += comparisons
+        stats.swaps += levels
+        stats.levels += levels
+        return comparisons
+    return wrapper
+
+
+def _percolation_levels(writes: int) -> int:
+    """
+    This helper function returns the number of levels a percolation helper moved the node and the hole from the
+    number of values it wrote: one per level, plus the node written into its final position.
+
+    Input: writes int
+
+    Output: int
+    """
+    return writes - 1
+
+
+def _smoothsort_swaps(writes: int) -> int:
+    """
+    This helper function returns the number of swaps _smoothsort() performed from the number of values it wrote,
+    two per swap.
+
+    Input: writes int
+
+    Output: int
+    """
+    return writes // 2
+
+
+class _CountingArray:
+    """
+    Stand-in for the DynamicArray passed to a heapsort helper function, which counts the values written to it.
+    """
+
+    def __init__(self, da: DynamicArray) -> None:
+        """
+        Initialize a new _CountingArray over input DynamicArray.
+        """
+        self._da = da
+        self.writes = 0
+
+    def __getitem__(self, index: int) -> object:
+        """
+        Return the value at input index of the DynamicArray.
+        """
+        return self._da[index]
+
+    def __setitem__(self, index: int, value: object) -> None:
+        """
+        Write input value at input index of the DynamicArray and count the write.
+        """
+        self.writes += 1
+        self._da[index] = value
+
+    def length(self) -> int:
+        """
+        Return the number of values stored in the DynamicArray.
+        """
+        return self._da.length()
+
+
+def _counted_heapsort(function):
+    """
+    This helper function returns a wrapper of heapsort() that counts the swaps of the heap root behind the shrinking
+    heap, which the percolation helpers do not see.
+
+    Input: function
+
+    Output: function
+    """
+    signature = inspect.signature(function)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        stats = _stats
+        result = function(*args, **kwargs)
+        if stats is None:
+            return result
+        arguments = signature.bind(*args, **kwargs).arguments
+        if arguments.get("method", "standard") != "adaptive":
+            stats.swaps += arguments["da"].length()
+        return result
+    return wrapper
+
+
+def _counted_resize(method):
+    """
+    This helper function returns a wrapper of DynamicArray.resize() that counts the resizes that took place and the
+    elements they copied.
+
+    Input: method
+
+    Output: method
+    """
+    @functools.wraps(method)
+    def wrapper(self, new_capacity):
+        stats = _stats
+        old_data = self._data
+        method(self, new_capacity)
+        if stats is not None and self._data is not old_data:
+            stats.resize_calls += 1
+            stats.elements_copied += self._size
+    return wrapper
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    print("\n# instrumentation example 1")
+    stats = enable()
+    h = MinHeap([5, 3, 8, 1, 9, 2])
+    h.add(0)
+    h.remove_min()
+    da = DynamicArray([100, 20, 6, 200, 90, 150, 300])
+    min_heap.heapsort(da, method="bottom_up")
+    print(snapshot())
+    disable()
+    print(is_enabled())
+
+    print("\n# instrumentation example 2")
+    enable(lambda operation, elapsed_ns, stats: print("callback:", operation, stats.comparisons))
+    h = MinHeap()
+    for value in [4, 2, 6]:
+        h.add(value)
+    disable()
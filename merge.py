@@ -0,0 +1,143 @@
+# Description: This file contains a lazy k-way merge of sorted sources. merge() is a generator that streams the values
+# of sorted DynamicArrays, lists or arbitrary iterators in sorted order, keeping one cursor per source in a MinHeap, so
+# it uses O(k) memory for k sources and produces its first value without reading more than one value per source. Two
+# sources are merged with a dedicated loop that needs no heap.
+
+from min_heap import *
+
+
+class _Reversed:
+    """
+    Wrapper that inverts the ordering of a priority value, so that a MinHeap returns the greatest value first.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: object) -> None:
+        """
+        Initialize a new _Reversed wrapper of input value.
+        """
+        self.value = value
+
+    def __lt__(self, other: "_Reversed") -> bool:
+        return other.value < self.value
+
+    def __gt__(self, other: "_Reversed") -> bool:
+        return self.value < other.value
+
+    def __eq__(self, other: "_Reversed") -> bool:
+        return self.value == other.value
+
+
+def merge(*sources, key=None, reverse: bool = False):
+    """
+    This generator function yields the values of every input source in non-descending order, or in non-ascending
+    order if reverse is True, where every source is a DynamicArray, list or iterator already sorted in that order. If
+    key is provided, values are ordered by key(value), which is called exactly once per value. Equal values are
+    yielded in the order of their sources.
+
+    Input: sorted DynamicArrays, lists or iterators, key function, reverse Boolean
+
+    Output: generator of objects
+    """
+    iterators = [iter(source) for source in sources]
+    if len(iterators) == 1:
+        yield from iterators[0]
+        return
+    if len(iterators) == 2:
+        yield from _merge_two(iterators[0], iterators[1], key, reverse)
+        return
+
+    # The MinHeap holds one (priority value, source index) cursor per non-empty source. The source index breaks ties,
+    # so values themselves are never compared and equal values keep the order of their sources.
+    heads = [None] * len(iterators)
+    heap = MinHeap()
+    for index, iterator in enumerate(iterators):
+        for value in iterator:
+            heads[index] = value
+            heap.add((priority_key(value, key, reverse), index))
+            break
+
+    while not heap.is_empty():
+        index = heap.get_min()[1]
+        yield heads[index]
+
+        # Advances the cursor of the source just used, with a single percolation per value.
+        for value in iterators[index]:
+            heads[index] = value
+            heap.replace((priority_key(value, key, reverse), index))
+            break
+        else:
+            heads[index] = None
+            heap.remove_min()
+
+
+def _merge_two(first, second, key, reverse: bool):
+    """
+    This helper generator function merges two sorted iterators without a heap, yielding the value of first when the
+    priority values are equal.
+
+    Input: iterator, iterator, key function, reverse Boolean
+
+    Output: generator of objects
+    """
+    done = object()
+    value_1, value_2 = next(first, done), next(second, done)
+    if value_1 is done or value_2 is done:
+        if value_1 is not done:
+            yield value_1
+            yield from first
+        elif value_2 is not done:
+            yield value_2
+            yield from second
+        return
+
+    key_1 = value_1 if key is None else key(value_1)
+    key_2 = value_2 if key is None else key(value_2)
+    while True:
+        if (key_1 < key_2) if reverse else (key_2 < key_1):
+            yield value_2
+            value_2 = next(second, done)
+            if value_2 is done:
+                yield value_1
+                yield from first
+                return
+            key_2 = value_2 if key is None else key(value_2)
+        else:
+            yield value_1
+            value_1 = next(first, done)
+            if value_1 is done:
+                yield value_2
+                yield from second
+                return
+            key_1 = value_1 if key is None else key(value_1)
+
+
+def priority_key(value: object, key, reverse: bool) -> object:
+    """
+    This helper function returns the priority value of input value for a MinHeap that orders values by key, in
+    reverse order if reverse is True.
+
+    Input: object, key function, reverse Boolean
+
+    Output: object
+    """
+    priority = value if key is None else key(value)
+    return _Reversed(priority) if reverse else priority
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    print("\n# merge example 1")
+    print(list(merge(DynamicArray([1, 4, 7]), [2, 5, 8], iter([3, 6, 9]))))
+    print(list(merge([1, 3, 5], DynamicArray([2, 4, 6, 8, 10]))))
+    print(list(merge([9, 5, 1], [8, 4], [7, 6, 0], reverse=True)))
+
+    print("\n# merge example 2")
+    da = DynamicArray([10, 20, 30, 30, 5, 10, 1, 2, 3, 4])
+    print(list(merge(*chunk(da))))
+    words = merge(['bear', 'horse', 'monkey'], ['zebra', 'elephant'], key=len)
+    print(next(words), list(words))
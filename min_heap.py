@@ -1,7 +1,22 @@
 # Description: This file contains a MinHeap implementation using a DynamicArray data structure. Various methods are
-# included to implement the MinHeap. A heapsort algorithm function is included to sort a DynamicArray data structure.
+# included to implement the MinHeap. The MinHeap can be binary or d-ary, where every node has up to arity child nodes.
+# A heapsort algorithm function is included to sort a DynamicArray data structure. dump() and load() save a MinHeap to
+# a compact binary file and restore it without re-heapifying.
+
+import operator
+import struct
+from array import array
 
 from dynamic_array import *
+from dynamic_array import _read_buffer, _write_file
+
+# Header of a MinHeap in a binary file: magic bytes, arity and flags, followed by the nodes and, if the MinHeap stores
+# separate priority values, the priority values, each saved by DynamicArray._dump_to().
+_HEAP_HEADER = struct.Struct("<4sHB1x")
+_HEAP_MAGIC = b"MNHP"
+_SEPARATE_KEYS = 1
+_KEY_FUNCTION = 2
+
 
 class MinHeapException(Exception):
     """
@@ -11,19 +26,77 @@ class MinHeapException(Exception):
     pass
 
 
+class HeapHandle:
+    """
+    Reference to a node stored in a MinHeap. Handles are returned by MinHeap.add(node, return_handle=True) and keep
+    track of the node's current position in the MinHeap, so that the node can be updated or removed without searching
+    for it.
+    """
+
+    def __init__(self, heap: "MinHeap", index: int) -> None:
+        """
+        Initialize a new HeapHandle for the node stored at input index of input MinHeap.
+        """
+        self._heap = heap
+        self._index = index
+
+    def __str__(self) -> str:
+        """
+        Return HeapHandle content in human-readable form
+        """
+        if not self.is_valid():
+            return "HANDLE (removed)"
+        return "HANDLE " + str(self.get_node())
+
+    def is_valid(self) -> bool:
+        """
+        This method returns True if the node referenced by the HeapHandle is still stored in its MinHeap, else
+        returns False.
+
+        Input: None
+
+        Output: Boolean
+        """
+        return self._heap is not None
+
+    def get_node(self) -> object:
+        """
+        This method returns the node referenced by the HeapHandle. Raises MinHeapException if the node has been
+        removed from its MinHeap.
+
+        Input: None
+
+        Output: object
+        """
+        if self._heap is None:
+            raise MinHeapException
+        return self._heap._heap[self._index]
+
+
 class MinHeap:
-    def __init__(self, start_heap=None):
+    def __init__(self, start_heap=None, arity: int = 2, key=None, priority_type: str = None):
         """
-        Initialize a new MinHeap
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Initialize a new MinHeap where every node has up to arity child nodes.
+        If key is provided, nodes are ordered by key(node) instead of the node itself.
+        If priority_type is provided, priority values are numbers stored in a typed DynamicArray of that array module
+        typecode (for example 'd' or 'q'), separately from the nodes, which are then never compared.
+        Raises MinHeapException if arity is less than 2.
         """
+        if arity < 2:
+            raise MinHeapException
+        self._arity = arity
+        self._key = key
+        self._priority_type = priority_type
         self._heap = DynamicArray()
+        # Parallel array of HeapHandle objects, _handles[i] references the node stored at _heap[i]. It is None until the
+        # first handle is requested, so MinHeaps that never use handles do not pay for keeping them in sync.
+        self._handles = None
+        # Parallel array of priority values, _keys[i] is the priority value of _heap[i].
+        self._keys = self._new_keys()
 
-        # populate MinHeap with initial values (if provided)
-        # before using this feature, implement add() method
+        # populate MinHeap with initial values (if provided) in a single bulk load
         if start_heap:
-            for node in start_heap:
-                self.add(node)
+            self.extend(start_heap)
 
     def __str__(self) -> str:
         """
@@ -33,25 +106,25 @@ class MinHeap:
         heap_data = [self._heap[i] for i in range(self._heap.length())]
         return "HEAP " + str(heap_data)
 
-    def add(self, node: object) -> None:
+    def add(self, node: object, priority: object = None, return_handle: bool = False) -> HeapHandle:
         """
         This method adds a node to the MinHeap and places it in the correct position based on MinHeap structure
-        requirements.
+        requirements. If return_handle is True, returns a HeapHandle that can be passed to decrease_key(),
+        increase_key() and remove(), else returns None. The first handle makes the MinHeap create a handle for every
+        node and keep them in sync from then on, which makes add() and remove_min() markedly slower (see the "MinHeap
+        handles" cases of benchmark.py), so MinHeaps that never ask for a handle do not pay for them. If priority is
+        provided, it is used as the node's priority value instead of key(node). Raises MinHeapException if priority is
+        provided to a MinHeap without a key function or priority_type, or if the priority value of a priority_type
+        MinHeap is missing or not a number of that type.
 
-        Input: object
+        Input: object, priority object, return_handle Boolean
 
-        Output: None
+        Output: HeapHandle or None
         """
-        self._heap.append(node)
-
-        current_index = self._heap.length() - 1
-
-        # Percolates node up the MinHeap according to MinHeap requirements.
-        while current_index > 0 and self._heap[(current_index - 1) // 2] > self._heap[current_index]:
-            temp = self._heap[current_index]
-            self._heap[current_index] = self._heap[(current_index - 1) // 2]
-            self._heap[(current_index - 1) // 2] = temp
-            current_index = (current_index - 1) // 2
+        self._append(node, priority)
+        index = self._percolate_up(self._heap.length() - 1)
+        if return_handle:
+            return self._get_handles()[index]
 
     def is_empty(self) -> bool:
         """
@@ -77,6 +150,19 @@ class MinHeap:
         else:
             return self._heap[0]
 
+    def get_min_priority(self) -> object:
+        """
+        This method returns the priority value of the object with the minimum priority value in the MinHeap. Raises
+        MinHeapException if MinHeap is empty.
+
+        Input: None
+
+        Output: object
+        """
+        if self._heap.is_empty():
+            raise MinHeapException
+        return self._keys[0]
+
     def remove_min(self) -> object:
         """
         This method removes the object with the minimum priority value from the MinHeap and returns the object.
@@ -91,14 +177,146 @@ class MinHeap:
 
         # Saves object with minimum priority value to be returned.
         temp_value = self._heap[0]
+        if self._handles is not None:
+            self._handles[0]._heap = None
 
         # Percolates new value down the MinHeap according to MinHeap structure requirements.
-        self._heap[0] = self._heap[self._heap.length() - 1]
-        self._heap.remove_at_index(self._heap.length() - 1)
-        _percolate_down(self._heap, 0, self._heap.length())
+        last_index = self._heap.length() - 1
+        self._move(last_index, 0)
+        self._remove_last()
+        if last_index > 0:
+            self._percolate_down(0, last_index)
 
         return temp_value
 
+    def decrease_key(self, handle: HeapHandle, node: object, priority: object = None) -> None:
+        """
+        This method replaces the node referenced by input handle with input node of lower or equal priority value and
+        moves it up the MinHeap according to MinHeap structure requirements. If priority is provided, it is used as
+        the node's new priority value, as in add(). Raises MinHeapException, and changes nothing, if the handle does
+        not reference a node of this MinHeap, if the priority value is invalid as in add(), or if input node has a
+        greater priority value than the current one.
+
+        Input: HeapHandle, object, priority object
+
+        Output: None
+        """
+        index = self._check_handle(handle)
+        key = self._get_priority(node, priority)
+        self._check_types((node,), (key,))
+        if self._keys[index] < key:
+            raise MinHeapException
+
+        self._heap[index] = node
+        self._keys[index] = key
+        self._percolate_up(index)
+
+    def increase_key(self, handle: HeapHandle, node: object, priority: object = None) -> None:
+        """
+        This method replaces the node referenced by input handle with input node of greater or equal priority value
+        and moves it down the MinHeap according to MinHeap structure requirements. If priority is provided, it is
+        used as the node's new priority value, as in add(). Raises MinHeapException, and changes nothing, if the
+        handle does not reference a node of this MinHeap, if the priority value is invalid as in add(), or if input
+        node has a lower priority value than the current one.
+
+        Input: HeapHandle, object, priority object
+
+        Output: None
+        """
+        index = self._check_handle(handle)
+        key = self._get_priority(node, priority)
+        self._check_types((node,), (key,))
+        if key < self._keys[index]:
+            raise MinHeapException
+
+        self._heap[index] = node
+        self._keys[index] = key
+        self._percolate_down(index, self._heap.length())
+
+    def remove(self, handle: HeapHandle) -> object:
+        """
+        This method removes the node referenced by input handle from the MinHeap and returns the node. MinHeap
+        adjusts accordingly to MinHeap structure requirements. Raises MinHeapException if the handle does not
+        reference a node of this MinHeap.
+
+        Input: HeapHandle
+
+        Output: object
+        """
+        index = self._check_handle(handle)
+        temp_value = self._heap[index]
+        handle._heap = None
+
+        # Moves the last node into the vacated position, then percolates it up or down as required.
+        last_index = self._heap.length() - 1
+        if index != last_index:
+            self._move(last_index, index)
+        self._remove_last()
+        if index != last_index and self._percolate_up(index) == index:
+            self._percolate_down(index, last_index)
+
+        return temp_value
+
+    def push_pop(self, node: object, priority: object = None) -> object:
+        """
+        This method adds a node to the MinHeap, then removes and returns the object with the minimum priority value,
+        with a single percolation. If input node has the minimum priority value, it is returned right away and the
+        MinHeap is unchanged. priority is handled as in add(). Raises MinHeapException, and changes nothing, if the
+        priority value is invalid as in add().
+
+        Input: object, priority object
+
+        Output: object
+        """
+        key = self._get_priority(node, priority)
+        self._check_types((node,), (key,))
+        if self._heap.is_empty() or not self._keys[0] < key:
+            return node
+        return self._replace_root(node, key)
+
+    def replace(self, node: object, priority: object = None) -> object:
+        """
+        This method removes and returns the object with the minimum priority value, then adds a node to the MinHeap,
+        with a single percolation. Unlike push_pop(), the returned object may have a greater priority value than input
+        node. priority is handled as in add(). Raises MinHeapException, and changes nothing, if MinHeap is empty or
+        the priority value is invalid as in add().
+
+        Input: object, priority object
+
+        Output: object
+        """
+        if self._heap.is_empty():
+            raise MinHeapException
+        key = self._get_priority(node, priority)
+        self._check_types((node,), (key,))
+        return self._replace_root(node, key)
+
+    def pop_many(self, count: int) -> DynamicArray:
+        """
+        This method removes up to count objects with the minimum priority values from the MinHeap and returns them in
+        non-descending priority order. Every object costs a single percolation, and the MinHeap arrays are shortened
+        once at the end. Raises MinHeapException if count is negative.
+
+        Input: count int
+
+        Output: DynamicArray
+        """
+        if count < 0:
+            raise MinHeapException
+        return self._pop_while(min(count, self._heap.length()), None)
+
+    def drain_until(self, threshold: object) -> DynamicArray:
+        """
+        This method removes all objects whose priority value is less than or equal to threshold from the MinHeap and
+        returns them in non-descending priority order. Every object costs a single percolation, and the MinHeap
+        arrays are shortened once at the end.
+
+        Input: threshold object
+
+        Output: DynamicArray
+        """
+        return self._pop_while(self._heap.length(), threshold)
+
     def build_heap(self, da: DynamicArray) -> None:
         """
         This method creates a MinHeap from an input DynamicArray.
@@ -107,12 +325,95 @@ class MinHeap:
 
         Output: None
         """
-        self._heap = DynamicArray()
-        for i in range(da.length()):
-            self._heap.append(da[i])
-        # Percolates interior nodes down the MinHeap according to MinHeap structure properties.
-        for i in range((self._heap.length()) // 2 - 1, -1, -1):
-            _percolate_down(self._heap, i, self._heap.length())
+        self.clear()
+        self._append_many(da)
+        self._heapify()
+
+    def extend(self, nodes, priorities=None) -> None:
+        """
+        This method adds all nodes of an input iterable to the MinHeap. The nodes are loaded in bulk, then either
+        percolated up one at a time or restored with a single O(n) heapify of the whole MinHeap, whichever is cheaper
+        for the size of the batch relative to the current size of the MinHeap. If priorities is provided, it is an
+        iterable of priority values parallel to nodes, as in add(). Raises MinHeapException, and adds nothing, if
+        priorities does not have one value per node or a priority value is invalid as in add().
+
+        Input: iterable of objects, iterable of priority objects
+
+        Output: None
+        """
+        old_size = self._heap.length()
+        self._append_many(nodes, priorities)
+
+        new_size = self._heap.length()
+        batch_size = new_size - old_size
+        if batch_size == 0:
+            return
+
+        # Percolating up costs about log2(new_size) per node in the worst case, heapify costs about 2 * new_size.
+        if batch_size * new_size.bit_length() >= 2 * new_size:
+            self._heapify()
+        else:
+            for i in range(old_size, new_size):
+                self._percolate_up(i)
+
+    def dump(self, path: str, typecode: str = None) -> None:
+        """
+        This method saves the MinHeap to a binary file at input path, in its current heap order. If typecode is
+        provided, the nodes are numbers written as machine values of that array module typecode, else they are
+        pickled. Priority values of a priority_type MinHeap are written as machine values. The key function is not
+        saved. Pickled nodes are restored with pickle, so only load files from a trusted source. The file is written
+        next to path and then moved onto it, so a dump that fails leaves the previous file as it was, and a MinHeap
+        loaded from the previous file through a memory map, including this one, keeps its nodes.
+
+        Input: path str, typecode str
+
+        Output: None
+        """
+        flags = _SEPARATE_KEYS if self._keys is not self._heap else 0
+        if self._key is not None:
+            flags |= _KEY_FUNCTION
+
+        def write(file) -> None:
+            file.write(_HEAP_HEADER.pack(_HEAP_MAGIC, self._arity, flags))
+            self._heap._dump_to(file, typecode)
+            if self._keys is not self._heap:
+                self._keys._dump_to(file)
+
+        _write_file(path, write)
+
+    @classmethod
+    def load(cls, path: str, key=None, use_mmap: bool = False) -> "MinHeap":
+        """
+        This method returns a new MinHeap with the nodes saved by dump(). The saved arrays already satisfy MinHeap
+        structure requirements, so they are used as they are without re-heapifying. If use_mmap is True, numeric
+        nodes and priority values are used in place through a copy-on-write memory map of the file, which is only
+        copied when the MinHeap grows beyond its saved size. A MinHeap saved with a key function must be loaded with
+        the same key function. Pickled nodes are restored with pickle, which can run arbitrary code, so never load a
+        file from an untrusted source. Raises MinHeapException if the file is invalid or the key function is missing.
+
+        Input: path str, key function, use_mmap Boolean
+
+        Output: MinHeap
+        """
+        buffer = _read_buffer(path, use_mmap)
+        if len(buffer) < _HEAP_HEADER.size:
+            raise MinHeapException
+        magic, arity, flags = _HEAP_HEADER.unpack_from(buffer, 0)
+        if magic != _HEAP_MAGIC or (flags & _KEY_FUNCTION and key is None):
+            raise MinHeapException
+        try:
+            nodes, offset = DynamicArray._load_from(buffer, _HEAP_HEADER.size, use_mmap)
+            keys = DynamicArray._load_from(buffer, offset, use_mmap)[0] if flags & _SEPARATE_KEYS else nodes
+        except DynamicArrayException:
+            raise MinHeapException
+        if keys.length() != nodes.length():
+            raise MinHeapException
+
+        priority_type = keys.get_typecode() if keys is not nodes else None
+        heap = cls(arity=arity, key=key if flags & _KEY_FUNCTION else None, priority_type=priority_type)
+        heap._heap = nodes
+        heap._keys = keys
+        return heap
 
     def size(self) -> int:
         """
@@ -126,75 +427,612 @@ class MinHeap:
 
     def clear(self) -> None:
         """
-        This method empties the MinHeap.
+        This method empties the MinHeap. HeapHandles of removed nodes are invalidated.
 
         Input: None
 
         Output: None
         """
+        if self._handles is not None:
+            for i in range(self._handles.length()):
+                self._handles[i]._heap = None
         self._heap = DynamicArray()
+        self._handles = None
+        self._keys = self._new_keys()
 
+    def _new_keys(self):
+        """
+        This helper method returns an empty array for the priority values of the MinHeap. Without a key function or
+        priority_type, the nodes are their own priority values and the array is the same DynamicArray as _heap.
 
-def heapsort(da: DynamicArray) -> None:
+        Input: None
+
+        Output: DynamicArray
+        """
+        if self._priority_type is not None:
+            return DynamicArray(typecode=self._priority_type)
+        if self._key is not None:
+            return DynamicArray()
+        return self._heap
+
+    def _get_handles(self) -> DynamicArray:
+        """
+        This helper method returns the parallel array of HeapHandles, creating a HeapHandle for every node the first
+        time it is called.
+
+        Input: None
+
+        Output: DynamicArray
+        """
+        if self._handles is None:
+            handles = DynamicArray()
+            handles.extend([HeapHandle(self, i) for i in range(self._heap.length())])
+            self._handles = handles
+        return self._handles
+
+    def _get_priority(self, node: object, priority: object) -> object:
+        """
+        This helper method returns the priority value of input node, which is input priority if provided, else
+        key(node), else the node itself. Raises MinHeapException if priority is provided to a MinHeap that stores no
+        separate priority values.
+
+        Input: object, priority object
+
+        Output: object
+        """
+        if priority is not None:
+            if self._keys is self._heap:
+                raise MinHeapException
+            return priority
+        if self._key is not None:
+            return self._key(node)
+        return node
+
+    def _append(self, node: object, priority: object = None) -> None:
+        """
+        This helper method appends a node, its priority value and, if the MinHeap keeps HeapHandles, a new HeapHandle
+        to the end of the MinHeap arrays without restoring MinHeap structure requirements. The key function is called
+        exactly once per node. Raises MinHeapException, and changes nothing, if the node or its priority value cannot
+        be stored in the MinHeap.
+
+        Input: object, priority object
+
+        Output: None
+        """
+        key = self._get_priority(node, priority)
+        self._check_types((node,), (key,))
+        if self._handles is not None:
+            self._handles.append(HeapHandle(self, self._heap.length()))
+        self._heap.append(node)
+        if self._keys is not self._heap:
+            self._keys.append(key)
+
+    def _append_many(self, nodes, priorities=None) -> None:
+        """
+        This helper method appends all nodes of an input iterable or DynamicArray, their priority values and, if the
+        MinHeap keeps HeapHandles, new HeapHandles to the end of the MinHeap arrays, resizing every array at most once,
+        without restoring MinHeap structure requirements. If priorities is provided, it is an iterable of priority
+        values parallel to nodes. Raises MinHeapException, and changes nothing, if priorities does not have one value
+        per node, or if a node or priority value cannot be stored in the MinHeap.
+
+        Input: iterable of objects or DynamicArray, iterable of priority objects
+
+        Output: None
+        """
+        nodes = nodes if isinstance(nodes, (list, tuple)) else list(nodes)
+        keys = nodes
+        if priorities is not None:
+            priorities = priorities if isinstance(priorities, (list, tuple)) else list(priorities)
+            if len(priorities) != len(nodes):
+                raise MinHeapException
+            keys = [self._get_priority(node, priority) for node, priority in zip(nodes, priorities)]
+        elif self._keys is not self._heap:
+            keys = [self._get_priority(node, None) for node in nodes]
+        self._check_types(nodes, keys)
+
+        start = self._heap.length()
+        self._heap.extend(nodes)
+        if self._handles is not None:
+            self._handles.extend([HeapHandle(self, i) for i in range(start, start + len(nodes))])
+        if self._keys is not self._heap:
+            self._keys.extend(keys)
+
+    def _check_types(self, nodes, keys) -> None:
+        """
+        This helper method raises MinHeapException if input nodes or priority values cannot be stored in the typed
+        DynamicArrays of the MinHeap, such as a missing or non-numeric priority value of a priority_type MinHeap, so
+        that a bad node is rejected before any MinHeap array is changed.
+
+        Input: list or tuple of objects, list or tuple of priority objects
+
+        Output: None
+        """
+        try:
+            if self._heap.get_typecode() is not None:
+                array(self._heap.get_typecode(), nodes)
+            if self._keys is not self._heap and self._keys.get_typecode() is not None:
+                array(self._keys.get_typecode(), keys)
+        except (TypeError, OverflowError):
+            raise MinHeapException
+
+    def _remove_last(self) -> None:
+        """
+        This helper method removes the last node, its priority value and its HeapHandle from the MinHeap arrays.
+
+        Input: None
+
+        Output: None
+        """
+        self._heap.pop()
+        if self._handles is not None:
+            self._handles.pop()
+        if self._keys is not self._heap:
+            self._keys.pop()
+
+    def _move(self, source: int, destination: int) -> None:
+        """
+        This helper method copies the node, priority value and HeapHandle at source index to destination index and
+        keeps the HeapHandle in sync.
+
+        Input: source index int, destination index int
+
+        Output: None
+        """
+        self._heap[destination] = self._heap[source]
+        if self._keys is not self._heap:
+            self._keys[destination] = self._keys[source]
+        if self._handles is not None:
+            handle = self._handles[source]
+            self._handles[destination] = handle
+            handle._index = destination
+
+    def _replace_root(self, node: object, key: object) -> object:
+        """
+        This helper method returns the root node and replaces it by input node with input priority value, which is
+        then percolated down. MinHeap must not be empty, and the node and priority value must have passed
+        _check_types(), since the root is changed before they are stored.
+
+        Input: object, priority object
+
+        Output: object
+        """
+        temp_value = self._heap[0]
+        if self._handles is not None:
+            self._handles[0]._heap = None
+            self._handles[0] = HeapHandle(self, 0)
+
+        self._heap[0] = node
+        if self._keys is not self._heap:
+            self._keys[0] = key
+        self._percolate_down(0, self._heap.length())
+        return temp_value
+
+    def _pop_while(self, count: int, threshold: object) -> DynamicArray:
+        """
+        This helper method removes up to count root nodes, stopping early at a root whose priority value is greater
+        than threshold unless threshold is None, and returns them in removal order. The last node is moved into the
+        root after every removal, but the MinHeap arrays are only shortened once, after the loop, with a single
+        remove_range().
+
+        Input: count int, threshold object
+
+        Output: DynamicArray
+        """
+        result = DynamicArray()
+        stop = self._heap.length()
+        for _ in range(count):
+            if threshold is not None and threshold < self._keys[0]:
+                break
+            result.append(self._heap[0])
+            if self._handles is not None:
+                self._handles[0]._heap = None
+            stop -= 1
+            if stop > 0:
+                self._move(stop, 0)
+                self._percolate_down(0, stop)
+
+        removed = self._heap.length() - stop
+        self._heap.remove_range(stop, removed)
+        if self._handles is not None:
+            self._handles.remove_range(stop, removed)
+        if self._keys is not self._heap:
+            self._keys.remove_range(stop, removed)
+        return result
+
+    def _heapify(self) -> None:
+        """
+        This helper method restores MinHeap structure requirements over the whole MinHeap in O(n) by percolating
+        interior nodes down, starting from the last interior node.
+
+        Input: None
+
+        Output: None
+        """
+        for i in range((self._heap.length() - 2) // self._arity, -1, -1):
+            self._percolate_down(i, self._heap.length())
+
+    def _check_handle(self, handle: HeapHandle) -> int:
+        """
+        This helper method returns the current index of the node referenced by input handle. Raises MinHeapException
+        if the handle does not reference a node of this MinHeap.
+
+        Input: HeapHandle
+
+        Output: int
+        """
+        if not isinstance(handle, HeapHandle) or handle._heap is not self:
+            raise MinHeapException
+        return handle._index
+
+    def _percolate_up(self, index: int) -> int:
+        """
+        This helper method moves the node at input index up the MinHeap based on MinHeap structure requirements and
+        keeps the HeapHandles, if any, in sync. Only the cached priority values are compared. Returns the final index of
+        the node.
+
+        Input: index int
+
+        Output: int
+        """
+        heap, keys, handles = self._heap, self._keys, self._handles
+        separate_keys = keys is not heap
+        node, key = heap[index], keys[index]
+        handle = handles[index] if handles is not None else None
+
+        # Shifts greater parent nodes down into the hole left by the node until its position is found.
+        arity = self._arity
+        while index > 0:
+            parent = (index - 1) // arity
+            if not key < keys[parent]:
+                break
+            heap[index] = heap[parent]
+            if separate_keys:
+                keys[index] = keys[parent]
+            if handle is not None:
+                moved = handles[parent]
+                handles[index] = moved
+                moved._index = index
+            index = parent
+
+        heap[index] = node
+        if separate_keys:
+            keys[index] = key
+        if handle is not None:
+            handles[index] = handle
+            handle._index = index
+        return index
+
+    def _percolate_down(self, index: int, stop: int) -> int:
+        """
+        This helper method moves the node at input index down the MinHeap based on MinHeap structure requirements and
+        keeps the HeapHandles, if any, in sync. Only the cached priority values are compared. Returns the final index of
+        the node.
+
+        Input: index int, stop index int
+
+        Output: int
+        """
+        heap, keys, handles = self._heap, self._keys, self._handles
+        separate_keys = keys is not heap
+        node, key = heap[index], keys[index]
+        handle = handles[index] if handles is not None else None
+
+        # Shifts the least child node up into the hole left by the node until its position is found.
+        arity = self._arity
+        first_child = arity * index + 1
+        while first_child < stop:
+            child = first_child
+            child_key = keys[child]
+            for i in range(first_child + 1, min(first_child + arity, stop)):
+                if keys[i] < child_key:
+                    child, child_key = i, keys[i]
+            if not child_key < key:
+                break
+            heap[index] = heap[child]
+            if separate_keys:
+                keys[index] = child_key
+            if handle is not None:
+                moved = handles[child]
+                handles[index] = moved
+                moved._index = index
+            index = child
+            first_child = arity * index + 1
+
+        heap[index] = node
+        if separate_keys:
+            keys[index] = key
+        if handle is not None:
+            handles[index] = handle
+            handle._index = index
+        return index
+
+
+def heapsort(da: DynamicArray, arity: int = 2, key=None, reverse: bool = False, order: str = "descending",
+             method: str = "standard") -> int:
     """
-    This function implements the heapsort algorithm to sort a DynamicArray data structure in non-ascending order.
+    This function implements the heapsort algorithm to sort a DynamicArray data structure in place, in non-ascending
+    order if order is "descending" or in non-descending order if order is "ascending". reverse=True reverses the
+    requested order. Ascending sorts build a max heap, so no second pass over the result is needed. If key is
+    provided, values are ordered by key(value), which is called exactly once per value. The intermediate heap has up
+    to arity child nodes per node.
 
-    Input: DynamicArray
+    With method "standard", every level of a percolation compares the children with each other and with the node.
+    With method "bottom_up", the hole left at the root is first moved down to a leaf comparing only the children, and
+    the node is then percolated back up from the leaf, which needs about half the comparisons.
+    With method "adaptive", the values are sorted by smoothsort, which uses a forest of Leonardo heaps instead of a
+    single heap (arity is ignored). It costs O(n) on input that is already sorted or nearly sorted, and O(n log n) in
+    the worst case.
 
-    Output: None
+    Returns the number of comparisons performed. Raises MinHeapException if arity is less than 2, or if order or
+    method is invalid.
+
+    Input: DynamicArray, arity int, key function, reverse Boolean, order str, method str
+
+    Output: int
     """
-    # Creates a MinHeap from input DynamicArray
-    for i in range((da.length()) // 2 - 1, -1, -1):
-        _percolate_down(da, i, da.length())
+    if arity < 2 or order not in ("ascending", "descending"):
+        raise MinHeapException
+    if method == "standard":
+        percolate = _percolate_down
+    elif method == "bottom_up":
+        percolate = _percolate_down_bottom_up
+    elif method != "adaptive":
+        raise MinHeapException
+
+    # A max heap moves the greatest values behind the shrinking heap first, which leaves them in ascending order.
+    max_heap = (order == "ascending") != reverse
+
+    # Priority values are cached in a parallel DynamicArray so the key function is never called while sorting.
+    keys = None
+    if key is not None:
+        keys = DynamicArray()
+        for i in range(da.length()):
+            keys.append(key(da[i]))
 
-    # Sorts MinHeap into non-ascending order according to MinHeap algorithm.
+    if method == "adaptive":
+        return _smoothsort(da, keys, max_heap)
+
+    # Creates a MinHeap (or a max heap) from input DynamicArray
+    comparisons = 0
+    for i in range((da.length() - 2) // arity, -1, -1):
+        comparisons += percolate(da, i, da.length(), arity, keys, max_heap)
+
+    # Sorts the heap by repeatedly swapping its root behind the shrinking heap.
     for i in range(da.length() - 1, -1, -1):
         temp = da[i]
         da[i] = da[0]
         da[0] = temp
+        if keys is not None:
+            temp = keys[i]
+            keys[i] = keys[0]
+            keys[0] = temp
 
-        _percolate_down(da, 0, i)
+        comparisons += percolate(da, 0, i, arity, keys, max_heap)
+
+    return comparisons
 
 # It's highly recommended that you implement the following optional          #
 # helper function for percolating elements down the MinHeap. You can call    #
 # this from inside the MinHeap class. You may edit the function definition.  #
 
 
-def _percolate_down(da: DynamicArray, parent: int, stop: int) -> None:
+def _percolate_down(da: DynamicArray, parent: int, stop: int, arity: int = 2, keys: DynamicArray = None,
+                    reverse: bool = False) -> int:
     """
-    This helper function moves a node down a MinHeap tree based on MinHeap structure requirements.
+    This helper function moves a node down a MinHeap tree with up to arity child nodes per node based on MinHeap
+    structure requirements. If keys is provided, it is a parallel DynamicArray of priority values that is compared
+    and moved in place of da's values. If reverse is True, the tree is treated as a max heap. Returns the number of
+    comparisons performed.
 
-    Input: DynamicArray, parent index int, stop index int
+    Input: DynamicArray, parent index int, stop index int, arity int, keys DynamicArray, reverse Boolean
 
-    Output: None
+    Output: int
     """
-    child_1_index = 2 * parent + 1
-    child_2_index = 2 * parent + 2
-
-    # Condition to check whether parent node needs to be switched positions with child node.
-    while ((child_1_index < stop and da[parent] > da[child_1_index]) or
-           (child_2_index < stop and da[parent] > da[child_2_index])):
-        # Condition to check if there are two child nodes to be compared.
-        if child_2_index < stop:
-            # Condition to check if parent node needs to be switched with left child or right child.
-            if da[child_1_index] <= da[child_2_index] and da[parent] > da[child_1_index]:
-                temp = da[parent]
-                da[parent] = da[child_1_index]
-                da[child_1_index] = temp
-                parent = child_1_index
+    if keys is None:
+        keys = da
+    separate_keys = keys is not da
+    precedes = operator.gt if reverse else operator.lt
+    node, key = da[parent], keys[parent]
+    comparisons = 0
+
+    # Shifts the least child node up into the hole left by the node until its position is found.
+    first_child = arity * parent + 1
+    while first_child < stop:
+        child = first_child
+        child_key = keys[child]
+        last_child = min(first_child + arity, stop)
+        for i in range(first_child + 1, last_child):
+            if precedes(keys[i], child_key):
+                child, child_key = i, keys[i]
+        comparisons += last_child - first_child
+        if not precedes(child_key, key):
+            break
+        da[parent] = da[child]
+        if separate_keys:
+            keys[parent] = child_key
+        parent = child
+        first_child = arity * parent + 1
+
+    da[parent] = node
+    if separate_keys:
+        keys[parent] = key
+    return comparisons
+
+
+def _percolate_down_bottom_up(da: DynamicArray, parent: int, stop: int, arity: int = 2, keys: DynamicArray = None,
+                              reverse: bool = False) -> int:
+    """
+    This helper function has the same effect on MinHeap structure as _percolate_down(), but first moves the hole left
+    by the node down to a leaf along the path of least children, then percolates the node up from that leaf. The node
+    is only compared on the way back up, which usually ends after one or two levels. Returns the number of comparisons
+    performed.
+
+    Input: DynamicArray, parent index int, stop index int, arity int, keys DynamicArray, reverse Boolean
+
+    Output: int
+    """
+    if keys is None:
+        keys = da
+    separate_keys = keys is not da
+    precedes = operator.gt if reverse else operator.lt
+    node, key = da[parent], keys[parent]
+    top = parent
+    comparisons = 0
+
+    # Shifts the least child node up into the hole until the hole reaches a leaf.
+    first_child = arity * parent + 1
+    while first_child < stop:
+        child = first_child
+        child_key = keys[child]
+        last_child = min(first_child + arity, stop)
+        for i in range(first_child + 1, last_child):
+            if precedes(keys[i], child_key):
+                child, child_key = i, keys[i]
+        comparisons += last_child - first_child - 1
+        da[parent] = da[child]
+        if separate_keys:
+            keys[parent] = child_key
+        parent = child
+        first_child = arity * parent + 1
+
+    # Shifts parent nodes back down into the hole until the node's position is found.
+    while parent > top:
+        up = (parent - 1) // arity
+        comparisons += 1
+        if not precedes(key, keys[up]):
+            break
+        da[parent] = da[up]
+        if separate_keys:
+            keys[parent] = keys[up]
+        parent = up
+
+    da[parent] = node
+    if separate_keys:
+        keys[parent] = key
+    return comparisons
+
+
+def _smoothsort(da: DynamicArray, keys: DynamicArray = None, ascending: bool = False) -> int:
+    """
+    This helper function sorts a DynamicArray in place with smoothsort, in non-descending order if ascending is True,
+    else in non-ascending order. If keys is provided, it is a parallel DynamicArray of priority values that is
+    compared and moved in place of da's values. Input that is already sorted is detected with one pass, and input
+    that is mostly in the opposite order is reversed first, so that both cases cost O(n). Returns the number of
+    comparisons performed.
+
+    Input: DynamicArray, keys DynamicArray, ascending Boolean
+
+    Output: int
+    """
+    if keys is None:
+        keys = da
+    separate_keys = keys is not da
+    # after(a, b) is True if a belongs strictly after b in the sorted result.
+    after = operator.gt if ascending else operator.lt
+    size = da.length()
+    comparisons = 0
+
+    def swap(i: int, j: int) -> None:
+        temp = da[i]
+        da[i] = da[j]
+        da[j] = temp
+        if separate_keys:
+            temp = keys[i]
+            keys[i] = keys[j]
+            keys[j] = temp
+
+    # Counts adjacent pairs that are out of order to detect sorted and reverse sorted input.
+    descents = 0
+    for i in range(size - 1):
+        if after(keys[i], keys[i + 1]):
+            descents += 1
+    comparisons += max(size - 1, 0)
+    if descents == 0:
+        return comparisons
+    if descents > (size - 1) // 2:
+        for i in range(size // 2):
+            swap(i, size - 1 - i)
+
+    # Leonardo numbers, leonardo[k] is the size of a Leonardo heap of order k.
+    leonardo = [1, 1]
+    while leonardo[-1] < size:
+        leonardo.append(leonardo[-1] + leonardo[-2] + 1)
+
+    def sift(root: int, order: int) -> None:
+        # Restores the heap property of the Leonardo heap of input order whose root is the last index root.
+        nonlocal comparisons
+        while order >= 2:
+            right = root - 1
+            left = right - leonardo[order - 2]
+            if after(keys[right], keys[left]):
+                child, child_order = right, order - 2
             else:
-                temp = da[parent]
-                da[parent] = da[child_2_index]
-                da[child_2_index] = temp
-                parent = child_2_index
-        # Condition where there is only one child node.
+                child, child_order = left, order - 1
+            comparisons += 2
+            if not after(keys[child], keys[root]):
+                break
+            swap(root, child)
+            root, order = child, child_order
+
+    def trinkle(root: int, heap: int) -> None:
+        # Moves the root of the heap-th Leonardo heap of the forest left along the heap roots while the root to its
+        # left belongs after it and after its children, then restores the heap it ends up in.
+        nonlocal comparisons
+        while heap > 0:
+            order = orders[heap]
+            stepson = root - leonardo[order]
+            comparisons += 1
+            if not after(keys[stepson], keys[root]):
+                break
+            if order >= 2:
+                right = root - 1
+                left = right - leonardo[order - 2]
+                comparisons += 1
+                if not after(keys[stepson], keys[left]):
+                    break
+                comparisons += 1
+                if not after(keys[stepson], keys[right]):
+                    break
+            swap(root, stepson)
+            root = stepson
+            heap -= 1
+        sift(root, orders[heap])
+
+    # Builds the forest of Leonardo heaps from left to right. A heap that will be merged into a larger heap later
+    # only needs its own heap property, heaps in their final position also keep the heap roots in sorted order.
+    orders = []
+    for i in range(size):
+        if len(orders) >= 2 and orders[-2] == orders[-1] + 1:
+            orders.pop()
+            orders[-1] += 1
+        elif orders and orders[-1] == 1:
+            orders.append(0)
+        else:
+            orders.append(1)
+
+        order = orders[-1]
+        remaining = size - 1 - i
+        if len(orders) >= 2 and orders[-2] == order + 1:
+            merged_later = remaining >= 1
+        else:
+            merged_later = order >= 1 and remaining >= leonardo[order - 1] + 1
+        if merged_later:
+            sift(i, order)
         else:
-            temp = da[parent]
-            da[parent] = da[child_1_index]
-            da[child_1_index] = temp
-            parent = child_1_index
-        child_1_index = 2 * parent + 1
-        child_2_index = 2 * parent + 2
+            trinkle(i, len(orders) - 1)
+
+    # Removes the rightmost root, which is the last value of the sorted result, and exposes its two children.
+    for i in range(size - 1, 0, -1):
+        order = orders.pop()
+        if order >= 2:
+            right = i - 1
+            left = right - leonardo[order - 2]
+            orders.append(order - 1)
+            trinkle(left, len(orders) - 1)
+            orders.append(order - 2)
+            trinkle(right, len(orders) - 1)
+
+    return comparisons
 
 
 # ------------------- BASIC TESTING -----------------------------------------
@@ -276,6 +1114,25 @@ if __name__ == '__main__':
     print(h.clear())
     print(h)
 
+    print("\nextend example 1")
+    print("----------------")
+    h = MinHeap([30, 10, 20])
+    h.extend([5, 25])
+    print(h)
+    h.extend(range(100, 90, -1))
+    print(h)
+
+    print("\ndecrease_key / increase_key / remove example 1")
+    print("------------------------------------------------")
+    h = MinHeap()
+    handles = [h.add(value, return_handle=True) for value in [50, 40, 30, 20, 10]]
+    print(h)
+    h.decrease_key(handles[0], 5)
+    print(h, handles[0])
+    h.increase_key(handles[4], 45)
+    print(h, handles[4])
+    print(h.remove(handles[2]), h, handles[2])
+
     print("\nPDF - heapsort example 1")
     print("------------------------")
     da = DynamicArray([100, 20, 6, 200, 90, 150, 300])
@@ -289,3 +1146,68 @@ if __name__ == '__main__':
     print(f"Before: {da}")
     heapsort(da)
     print(f"After:  {da}")
+
+    print("\nd-ary MinHeap example 1")
+    print("-----------------------")
+    for arity in [2, 4, 8]:
+        h = MinHeap(range(20, 0, -1), arity)
+        print(arity, h)
+        print(h.remove_min(), h.remove_min(), h)
+
+    print("\nd-ary heapsort example 1")
+    print("------------------------")
+    da = DynamicArray([100, 20, 6, 200, 90, 150, 300])
+    heapsort(da, 4)
+    print(da)
+
+    print("\nkey function example 1")
+    print("----------------------")
+    h = MinHeap(['monkey', 'zebra', 'elephant', 'horse', 'bear'], key=len)
+    print(h)
+    print(h.remove_min(), h.remove_min(), h)
+    da = DynamicArray(['monkey', 'zebra', 'elephant', 'horse', 'bear'])
+    heapsort(da, key=len, reverse=True)
+    print(da)
+
+    print("\npriority_type example 1")
+    print("-----------------------")
+    h = MinHeap(priority_type='d')
+    for payload, priority in [('write', 2.5), ('read', 1.0), ('flush', 9.0), ('sync', 0.5)]:
+        h.add(payload, priority)
+    print(h)
+    while not h.is_empty():
+        print(h.get_min_priority(), h.remove_min())
+
+    print("\nheapsort order / method example 1")
+    print("---------------------------------")
+    for method in ["standard", "bottom_up", "adaptive"]:
+        for order in ["descending", "ascending"]:
+            da = DynamicArray([100, 20, 6, 200, 90, 150, 300])
+            comparisons = heapsort(da, order=order, method=method)
+            print(f"{method:<10}{order:<11}{comparisons:>3} comparisons: {da}")
+
+    print("\npush_pop / replace / pop_many / drain_until example 1")
+    print("----------------------------------------------------")
+    h = MinHeap([5, 3, 8, 1, 9, 2, 7])
+    print(h.push_pop(0), h.push_pop(4), h)
+    print(h.replace(10), h)
+    print(h.pop_many(2), h)
+    print(h.drain_until(8), h)
+
+    print("\ndump / load example 1")
+    print("---------------------")
+    import os
+    import tempfile
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "heap.bin")
+        MinHeap([5, 3, 8, 1, 9, 2, 7], arity=3).dump(path, 'q')
+        h = MinHeap.load(path, use_mmap=True)
+        print(h)
+        print(h.remove_min(), h)
+        h = MinHeap(priority_type='d')
+        for payload, priority in [('write', 2.5), ('read', 1.0), ('flush', 9.0)]:
+            h.add(payload, priority)
+        h.dump(path)
+        h = MinHeap.load(path)
+        h.add('sync', 0.5)
+        print(h, h.get_min_priority())
@@ -0,0 +1,250 @@
+# Description: This file contains an optional NumPy engine for heapify, heapsort and nsmallest on numeric data. The
+# functions accept a DynamicArray or a NumPy ndarray of numbers. Heapify works level by level: all interior nodes of a
+# level have disjoint subtrees, so they are percolated down together with vectorized parent/child compare-and-swap
+# steps, which gives exactly the same heap as the pure-Python engine in min_heap.py. When NumPy is not installed, or an
+# untyped DynamicArray holds values NumPy cannot store exactly as machine numbers of one type (such as integers beyond
+# the range of int64, or ints mixed with floats), every function falls back to the pure-Python engine.
+
+from min_heap import *
+from min_heap import _percolate_down
+from min_heap import heapsort as _heapsort_python
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def is_available() -> bool:
+    """
+    This function returns True if NumPy is installed and the vectorized engine is used, else returns False.
+
+    Input: None
+
+    Output: Boolean
+    """
+    return np is not None
+
+
+def to_ndarray(values) -> "np.ndarray":
+    """
+    This function returns the numbers of an input DynamicArray or ndarray as a one dimensional ndarray. Typed
+    DynamicArrays are wrapped without copying, so changes to the ndarray are made to the DynamicArray itself.
+    Raises MinHeapException if NumPy is not installed.
+
+    Input: DynamicArray or ndarray
+
+    Output: ndarray
+    """
+    if np is None:
+        raise MinHeapException
+    if isinstance(values, np.ndarray):
+        return values
+    if values.get_typecode() is not None:
+        return np.frombuffer(values.get_buffer(), dtype=np.dtype(values.get_typecode()))
+    return np.array([values[i] for i in range(values.length())])
+
+
+def heapify(values, arity: int = 2) -> None:
+    """
+    This function rearranges an input DynamicArray or ndarray of numbers in place so that it satisfies MinHeap
+    structure requirements for a heap with up to arity child nodes per node. Raises MinHeapException if arity is less
+    than 2.
+
+    Input: DynamicArray or ndarray, arity int
+
+    Output: None
+    """
+    if arity < 2:
+        raise MinHeapException
+    data = _numeric_ndarray(values)
+    if data is None:
+        for i in range((values.length() - 2) // arity, -1, -1):
+            _percolate_down(values, i, values.length(), arity)
+        return
+
+    _heapify_ndarray(data, arity)
+    _write_back(values, data)
+
+
+def heapsort(values, arity: int = 2, reverse: bool = False, order: str = "descending") -> None:
+    """
+    This function sorts an input DynamicArray or ndarray of numbers in place in non-ascending order if order is
+    "descending" or in non-descending order if order is "ascending", with the same result as heapsort() in
+    min_heap.py. reverse=True reverses the requested order. Raises MinHeapException if arity is less than 2 or if
+    order is invalid.
+
+    Input: DynamicArray or ndarray, arity int, reverse Boolean, order str
+
+    Output: None
+    """
+    if arity < 2 or order not in ("ascending", "descending"):
+        raise MinHeapException
+    data = _numeric_ndarray(values)
+    if data is None:
+        _heapsort_python(values, arity, reverse=reverse, order=order)
+        return
+
+    # Sorting numbers leaves no observable difference between sorting algorithms, so the vectorized sort is used.
+    data.sort()
+    if (order == "ascending") == reverse:
+        data[:] = data[::-1].copy()
+    _write_back(values, data)
+
+
+def nsmallest(values, k: int) -> "np.ndarray":
+    """
+    This function returns the k smallest numbers of an input DynamicArray or ndarray in non-descending order as a new
+    ndarray, or as a new DynamicArray if the pure-Python engine is used. The input is not modified.
+
+    Input: DynamicArray or ndarray, k int
+
+    Output: ndarray or DynamicArray
+    """
+    data = _numeric_ndarray(values)
+    if data is None:
+        result = DynamicArray(typecode=values.get_typecode())
+        h = MinHeap(values)
+        for _ in range(min(k, h.size())):
+            result.append(h.remove_min())
+        return result
+
+    k = max(0, min(k, data.size))
+    if k == 0:
+        return data[:0].copy()
+    if k == data.size:
+        return np.sort(data)
+    return np.sort(np.partition(data, k - 1)[:k])
+
+
+def build_heap(heap: MinHeap, values) -> None:
+    """
+    This function replaces the content of an input MinHeap without a key function by the numbers of an input
+    DynamicArray or ndarray, which are heapified by the vectorized engine. Raises MinHeapException if the MinHeap has
+    a key function or priority_type.
+
+    Input: MinHeap, DynamicArray or ndarray
+
+    Output: None
+    """
+    if heap._keys is not heap._heap:
+        raise MinHeapException
+    data = _numeric_ndarray(values)
+    if data is None:
+        heap.build_heap(values)
+        return
+
+    data = data.copy()
+    _heapify_ndarray(data, heap._arity)
+    heap.clear()
+    heap._append_many(data.tolist())
+
+
+def _numeric_ndarray(values):
+    """
+    This helper function returns the numbers of an input DynamicArray or ndarray as an ndarray for the vectorized
+    engine, or None if the pure-Python engine must be used instead so that the result is exactly the same: NumPy is
+    not installed, or an untyped DynamicArray does not hold only ints or only floats that an integer or floating
+    point ndarray stores exactly. Mixed ints and floats would come back as floats, and large ints would be rounded.
+    Raises MinHeapException for an ndarray without an integer or floating point dtype, which the pure-Python engine
+    cannot process.
+
+    Input: DynamicArray or ndarray
+
+    Output: ndarray
+    """
+    if np is None:
+        return None
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind not in "iuf":
+            raise MinHeapException
+        return values
+    if values.get_typecode() is not None:
+        return to_ndarray(values)
+
+    items = list(values)
+    if not items or len(set(map(type, items))) != 1 or type(items[0]) not in (int, float):
+        return None
+    data = np.array(items)
+    if data.dtype.kind not in "iuf" or data.tolist() != items:
+        return None
+    return data
+
+
+def _heapify_ndarray(data: "np.ndarray", arity: int) -> None:
+    """
+    This helper function heapifies an ndarray in place, one level of interior nodes at a time starting from the
+    deepest level, percolating every node of a level down in parallel.
+
+    Input: ndarray, arity int
+
+    Output: None
+    """
+    size = data.size
+    if size < 2:
+        return
+
+    # Index ranges [start, end) of every level of the tree.
+    levels = []
+    start, width = 0, 1
+    while start < size:
+        levels.append((start, min(start + width, size)))
+        start, width = start + width, width * arity
+
+    last_interior = (size - 2) // arity
+    for start, end in reversed(levels):
+        if start > last_interior:
+            continue
+        _sift_down_many(data, np.arange(start, min(end, last_interior + 1)), size, arity)
+
+
+def _sift_down_many(data: "np.ndarray", nodes: "np.ndarray", stop: int, arity: int) -> None:
+    """
+    This helper function percolates the nodes at input indices down in parallel. The nodes must have disjoint
+    subtrees. Children are compared in a matrix with one row per node, padded with the largest value of the dtype so
+    that np.argmin picks the leftmost least child, as the pure-Python engine does.
+
+    Input: ndarray, ndarray of indices, stop index int, arity int
+
+    Output: None
+    """
+    if np.issubdtype(data.dtype, np.floating):
+        padding = np.inf
+    else:
+        padding = np.iinfo(data.dtype).max
+    offsets = np.arange(arity)
+
+    while nodes.size:
+        first_child = nodes * arity + 1
+        has_child = first_child < stop
+        nodes, first_child = nodes[has_child], first_child[has_child]
+        if not nodes.size:
+            break
+
+        children = first_child[:, None] + offsets
+        candidates = np.where(children < stop, data[np.minimum(children, stop - 1)], padding)
+        best = np.argmin(candidates, axis=1)
+        rows = np.arange(nodes.size)
+        child = children[rows, best]
+
+        swap = candidates[rows, best] < data[nodes]
+        nodes, child = nodes[swap], child[swap]
+        temp = data[nodes]
+        data[nodes] = data[child]
+        data[child] = temp
+        nodes = child
+
+
+def _write_back(values, data: "np.ndarray") -> None:
+    """
+    This helper function copies the numbers of an ndarray back into an input untyped DynamicArray. Typed
+    DynamicArrays and ndarrays already share data's memory and are left as is.
+
+    Input: DynamicArray or ndarray, ndarray
+
+    Output: None
+    """
+    if isinstance(values, np.ndarray) or values.get_typecode() is not None:
+        return
+    for i, value in enumerate(data.tolist()):
+        values[i] = value
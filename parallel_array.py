@@ -0,0 +1,252 @@
+# Description: This file contains parallel versions of DynamicArray.map(), filter() and reduce() for CPU-heavy
+# functions over large DynamicArrays. The values are split into contiguous chunks that run on a process pool (or a
+# thread pool, for functions that release the interpreter lock), and the chunk results are put back in order. reduce()
+# combines the chunk results as a balanced tree when the function is associative. Typed DynamicArrays are shipped as
+# compact array module arrays, other DynamicArrays as one pickled list per chunk.
+#
+# Without an explicit chunk_size, tune_chunk_size() times the function on a small sample of the values. It picks
+# chunks long enough to amortize the cost of shipping a chunk to a worker, short enough to give every worker several
+# chunks for load balancing, and reports when the whole job is too cheap to be worth a pool, in which case the serial
+# DynamicArray method is used. Functions sent to a process pool must be picklable, such as module level functions.
+
+import functools
+import math
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from dynamic_array import *
+
+# Smallest number of values processed in parallel by default.
+PARALLEL_THRESHOLD = 10000
+
+# Estimated serial time in seconds below which the serial DynamicArray method is used.
+SERIAL_SECONDS = 0.05
+
+# Time in seconds a chunk should take, so that shipping it to a worker costs little in comparison.
+TARGET_CHUNK_SECONDS = 0.01
+
+# Number of chunks per worker the chunk size aims for at least, so that faster workers can take over more chunks.
+CHUNKS_PER_WORKER = 4
+
+# Number of values timed by tune_chunk_size().
+SAMPLE_SIZE = 64
+
+
+def parallel_map(da: DynamicArray, map_func, workers: int = None, chunk_size: int = None, executor: str = "process",
+                 threshold: int = PARALLEL_THRESHOLD) -> DynamicArray:
+    """
+    This function returns a new DynamicArray with map_func applied to every value of an input DynamicArray, as
+    DynamicArray.map() does, running contiguous chunks on up to workers workers (default: the number of CPUs) of a
+    "process" or "thread" pool. DynamicArrays shorter than threshold, or cheap enough that a pool would not pay off,
+    are mapped serially. Raises DynamicArrayException if executor is invalid.
+
+    Input: DynamicArray, map_func function, workers int, chunk_size int, executor str, threshold int
+
+    Output: DynamicArray
+    """
+    chunk_size, workers = _plan(da, map_func, workers, chunk_size, executor, threshold, "map")
+    if chunk_size == 0:
+        return da.map(map_func)
+
+    result = DynamicArray()
+    if da.length() > result.get_capacity():
+        result.resize(da.length())
+    with _executor(executor, workers) as pool:
+        for values in pool.map(_map_chunk, *_chunk_arguments(da, map_func, chunk_size)):
+            result.extend(values)
+    return result
+
+
+def parallel_filter(da: DynamicArray, filter_func, workers: int = None, chunk_size: int = None,
+                    executor: str = "process", threshold: int = PARALLEL_THRESHOLD) -> DynamicArray:
+    """
+    This function returns a new DynamicArray with the values of an input DynamicArray for which filter_func returns
+    True, in their original order, as DynamicArray.filter() does, running contiguous chunks on up to workers workers
+    of a "process" or "thread" pool. Small or cheap jobs are filtered serially. Raises DynamicArrayException if
+    executor is invalid.
+
+    Input: DynamicArray, filter_func function, workers int, chunk_size int, executor str, threshold int
+
+    Output: DynamicArray
+    """
+    chunk_size, workers = _plan(da, filter_func, workers, chunk_size, executor, threshold, "filter")
+    if chunk_size == 0:
+        return da.filter(filter_func)
+
+    result = DynamicArray(typecode=da.get_typecode())
+    with _executor(executor, workers) as pool:
+        for values in pool.map(_filter_chunk, *_chunk_arguments(da, filter_func, chunk_size)):
+            result.extend(values)
+    return result
+
+
+def parallel_reduce(da: DynamicArray, reduce_func, initializer=None, associative: bool = True, workers: int = None,
+                    chunk_size: int = None, executor: str = "process", threshold: int = PARALLEL_THRESHOLD) -> object:
+    """
+    This function returns the values of an input DynamicArray combined by reduce_func, as DynamicArray.reduce()
+    does. Every chunk is reduced on up to workers workers of a "process" or "thread" pool, and the chunk results are
+    combined pairwise as a balanced tree, which gives the same result as a serial reduce only if reduce_func is
+    associative; otherwise pass associative=False to reduce serially. initializer is only combined with the first
+    value. Small or cheap jobs are reduced serially. Raises DynamicArrayException if executor is invalid.
+
+    Input: DynamicArray, reduce_func function, initializer object, associative Boolean, workers int, chunk_size int,
+           executor str, threshold int
+
+    Output: object
+    """
+    if not associative or da.length() < 2:
+        return da.reduce(reduce_func, initializer)
+    chunk_size, workers = _plan(da, lambda value: reduce_func(value, value), workers, chunk_size, executor,
+                                threshold, "reduce")
+    if chunk_size == 0:
+        return da.reduce(reduce_func, initializer)
+
+    with _executor(executor, workers) as pool:
+        results = list(pool.map(_reduce_chunk, *_chunk_arguments(da, reduce_func, chunk_size)))
+    if initializer is not None:
+        results[0] = reduce_func(initializer, results[0])
+
+    # Combines neighbouring results level by level, keeping their order.
+    while len(results) > 1:
+        combined = [reduce_func(results[i], results[i + 1]) for i in range(0, len(results) - 1, 2)]
+        if len(results) % 2:
+            combined.append(results[-1])
+        results = combined
+    return results[0]
+
+
+def tune_chunk_size(da: DynamicArray, func, workers: int) -> int:
+    """
+    This function returns a chunk size for running func over the values of an input DynamicArray on workers
+    workers, or 0 if running them serially is expected to be faster. It times func on up to SAMPLE_SIZE values
+    spread over the DynamicArray, so func is called on those values once more.
+
+    Input: DynamicArray, func function, workers int
+
+    Output: int
+    """
+    length = da.length()
+    if length == 0 or workers < 2:
+        return 0
+    step = max(1, length // SAMPLE_SIZE)
+    sample = list(da.iter_range(0, length, step))[:SAMPLE_SIZE]
+    start = time.perf_counter()
+    for value in sample:
+        func(value)
+    cost = max((time.perf_counter() - start) / len(sample), 1e-9)
+    if cost * length < SERIAL_SECONDS:
+        return 0
+
+    # Long enough to amortize shipping the chunk, short enough to give every worker several chunks.
+    chunk_size = math.ceil(TARGET_CHUNK_SECONDS / cost)
+    return max(1, min(chunk_size, math.ceil(length / (workers * CHUNKS_PER_WORKER))))
+
+
+def _plan(da: DynamicArray, func, workers: int, chunk_size: int, executor: str, threshold: int,
+          kind: str) -> tuple:
+    """
+    This helper function returns the chunk size and number of workers of a parallel job, with a chunk size of 0 if
+    the job should run serially. Raises DynamicArrayException if executor is invalid.
+
+    Input: DynamicArray, func function, workers int, chunk_size int, executor str, threshold int, kind str
+
+    Output: tuple
+    """
+    if executor not in ("process", "thread"):
+        raise DynamicArrayException
+    workers = workers or os.cpu_count() or 1
+    if da.length() < threshold or workers < 2:
+        return 0, workers
+    if chunk_size is None:
+        chunk_size = tune_chunk_size(da, func, workers)
+    return max(0, chunk_size), workers
+
+
+def _executor(executor: str, workers: int):
+    """
+    This helper function returns a new process or thread pool of input number of workers.
+
+    Input: executor str, workers int
+
+    Output: Executor
+    """
+    return ProcessPoolExecutor(workers) if executor == "process" else ThreadPoolExecutor(workers)
+
+
+def _chunk_arguments(da: DynamicArray, func, chunk_size: int) -> tuple:
+    """
+    This helper function returns the arguments of Executor.map() for every contiguous chunk of an input
+    DynamicArray: a sequence of func and a sequence of chunks, which are array module arrays for typed DynamicArrays
+    and lists otherwise.
+
+    Input: DynamicArray, func function, chunk_size int
+
+    Output: tuple
+    """
+    length = da.length()
+    typecode = da.get_typecode()
+    chunks = []
+    for start in range(0, length, chunk_size):
+        stop = min(start + chunk_size, length)
+        if typecode is not None:
+            chunks.append(array(typecode, da.get_buffer()[start:stop].tobytes()))
+        else:
+            chunks.append(list(da.iter_range(start, stop)))
+    return [func] * len(chunks), chunks
+
+
+def _map_chunk(map_func, values) -> list:
+    """
+    This helper function runs in a worker and returns map_func applied to every value of a chunk.
+
+    Input: map_func function, list or array
+
+    Output: list
+    """
+    return list(map(map_func, values))
+
+
+def _filter_chunk(filter_func, values):
+    """
+    This helper function runs in a worker and returns the values of a chunk for which filter_func returns True, as
+    the same type as the chunk.
+
+    Input: filter_func function, list or array
+
+    Output: list or array
+    """
+    kept = filter(filter_func, values)
+    return array(values.typecode, kept) if isinstance(values, array) else list(kept)
+
+
+def _reduce_chunk(reduce_func, values) -> object:
+    """
+    This helper function runs in a worker and returns the values of a chunk combined by reduce_func.
+
+    Input: reduce_func function, list or array
+
+    Output: object
+    """
+    return functools.reduce(reduce_func, values)
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    import operator
+
+    print("\n# parallel_map / parallel_filter / parallel_reduce example 1")
+    da = DynamicArray(range(20), 'q')
+    print(parallel_map(da, abs, workers=3, chunk_size=6, threshold=0))
+    print(parallel_filter(da, bool, workers=3, chunk_size=6, threshold=0))
+    print(parallel_reduce(da, operator.add, 100, workers=3, chunk_size=6, threshold=0))
+
+    print("\n# parallel_map / parallel_reduce example 2")
+    da = DynamicArray(['This', 'is', 'a', 'sentence'])
+    print(parallel_map(da, str.upper, workers=2, chunk_size=1, executor="thread", threshold=0))
+    print(parallel_reduce(da, operator.add, workers=2, chunk_size=3, threshold=0))
+    print(parallel_map(da, len), tune_chunk_size(da, len, 4))
@@ -0,0 +1,132 @@
+# Description: This file contains parallel_heapsort(), which sorts a DynamicArray on several cores. The input is split
+# into one contiguous partition per worker process, every partition is heapsorted in a process pool, and the sorted
+# partitions are combined with the heap-based k-way merge of merge.py. Typed DynamicArrays are shipped to the workers
+# through one block of shared memory that the workers sort in place, so no value is pickled; other DynamicArrays are
+# sent as one pickled list per partition. Below a size threshold, or with a single process, the serial heapsort() is
+# used, since starting workers costs more than it saves.
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from merge import merge
+from min_heap import *
+
+# Smallest number of values sorted in parallel by default.
+PARALLEL_THRESHOLD = 100000
+
+
+def parallel_heapsort(da: DynamicArray, processes: int = None, key=None, reverse: bool = False,
+                      order: str = "descending", method: str = "standard",
+                      threshold: int = PARALLEL_THRESHOLD) -> None:
+    """
+    This function sorts a DynamicArray in place in the same order as heapsort() with the same key, reverse, order
+    and method, heapsorting partitions in up to processes worker processes (default: the number of CPUs) and merging
+    them. key must be picklable, such as a module level function. DynamicArrays shorter than threshold are sorted by
+    the serial heapsort(). Raises MinHeapException if order or method is invalid.
+
+    Input: DynamicArray, processes int, key function, reverse Boolean, order str, method str, threshold int
+
+    Output: None
+    """
+    if order not in ("ascending", "descending") or method not in ("standard", "bottom_up", "adaptive"):
+        raise MinHeapException
+    size = da.length()
+    processes = processes or os.cpu_count() or 1
+    if size < threshold or processes < 2 or size < 2:
+        heapsort(da, key=key, reverse=reverse, order=order, method=method)
+        return
+
+    parts = min(processes, size)
+    bounds = [size * i // parts for i in range(parts + 1)]
+    options = (key, reverse, order, method)
+    descending = (order == "descending") != reverse
+    typecode = da.get_typecode()
+
+    with ProcessPoolExecutor(parts) as pool:
+        if typecode is None:
+            chunks = [[da[i] for i in range(bounds[p], bounds[p + 1])] for p in range(parts)]
+            runs = list(pool.map(_sort_list, chunks, [options] * parts))
+            for index, value in enumerate(merge(*runs, key=key, reverse=descending)):
+                da[index] = value
+            return
+
+        source = da.get_buffer()
+        memory = shared_memory.SharedMemory(create=True, size=source.nbytes)
+        shared = None
+        runs = []
+        try:
+            shared = memory.buf.cast("B")[:source.nbytes].cast(typecode)
+            shared[:] = source
+            futures = [pool.submit(_sort_shared, memory.name, typecode, bounds[p], bounds[p + 1], options)
+                       for p in range(parts)]
+            for future in futures:
+                future.result()
+            runs = [shared[bounds[p]:bounds[p + 1]] for p in range(parts)]
+            source[:] = array(typecode, merge(*runs, key=key, reverse=descending))
+        finally:
+            # Views of the block must be released before it can be closed, also when a worker failed.
+            for run in runs:
+                run.release()
+            if shared is not None:
+                shared.release()
+            try:
+                memory.close()
+            finally:
+                memory.unlink()
+
+
+def _sort_list(values: list, options: tuple) -> list:
+    """
+    This helper function runs in a worker process and returns input values heapsorted with input options.
+
+    Input: list, (key, reverse, order, method) tuple
+
+    Output: list
+    """
+    key, reverse, order, method = options
+    da = DynamicArray(values)
+    heapsort(da, key=key, reverse=reverse, order=order, method=method)
+    return [da[i] for i in range(da.length())]
+
+
+def _sort_shared(name: str, typecode: str, start: int, stop: int, options: tuple) -> None:
+    """
+    This helper function runs in a worker process and heapsorts the values from index start to stop of the shared
+    memory block with input name in place, through a DynamicArray that uses the block as its storage.
+
+    Input: name str, typecode str, start int, stop int, (key, reverse, order, method) tuple
+
+    Output: None
+    """
+    key, reverse, order, method = options
+    memory = shared_memory.SharedMemory(name=name)
+    itemsize = array(typecode).itemsize
+    view = memory.buf[start * itemsize:stop * itemsize].cast(typecode)
+    da = DynamicArray._wrap(StaticArray.from_buffer(view, typecode))
+    heapsort(da, key=key, reverse=reverse, order=order, method=method)
+    # If heapsort() raises, its exception is passed on as it is and the block is closed when the worker drops it.
+    del da
+    view.release()
+    memory.close()
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    import random
+
+    print("\n# parallel_heapsort example 1")
+    da = DynamicArray([random.randrange(1000) for _ in range(20)], 'q')
+    parallel_heapsort(da, processes=4, threshold=0, order="ascending")
+    print(da)
+
+    print("\n# parallel_heapsort example 2")
+    da = DynamicArray(['monkey', 'zebra', 'elephant', 'horse', 'bear', 'ox', 'giraffe'])
+    parallel_heapsort(da, processes=3, threshold=0, key=len)
+    print(da)
+    parallel_heapsort(da)
+    print(da)
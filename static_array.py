@@ -2,6 +2,13 @@
 #               Be sure to go through this entire file to see what operations
 #               are available to the StaticArray. Also, see the __main__ block
 #               at the bottom for some tips on how to use the StaticArray.
+#               A StaticArray created with an array module typecode stores
+#               numbers as contiguous machine values instead of Python objects.
+#               StaticArray.from_buffer() wraps existing storage, such as a
+#               memory mapped file, without copying it.
+
+from array import array
+
 
 class StaticArrayException(Exception):
     """
@@ -14,7 +21,9 @@ class StaticArrayException(Exception):
 class StaticArray:
     """
     Implementation of Static Array Data Structure.
-    Implemented methods: get(), set(), length()
+    Implemented methods: get(), set(), length(), get_typecode(), get_buffer(),
+                         copy_from(), set_range(), get_range(),
+                         from_buffer()
 
     Any changes to this class are forbidden.
 
@@ -24,10 +33,12 @@ class StaticArray:
     a StaticArray file is ignored.
     """
 
-    def __init__(self, size: int = 10) -> None:
+    def __init__(self, size: int = 10, typecode: str = None) -> None:
         """
         Create array of given size.
         Initialize all elements with values of None.
+        If typecode is given (an array module typecode such as 'd' or 'q'),
+        elements are stored as machine values and initialized with 0.
         If requested size is not a positive number,
         raise StaticArray Exception.
         """
@@ -42,7 +53,34 @@ class StaticArray:
         # Remember, this is a built-in list and is used here
         # because Python doesn't have a fixed-size array type.
         # Don't initialize variables like this in your assignments!
-        self._data = [None] * size
+        self._typecode = typecode
+        if typecode is None:
+            self._data = [None] * size
+        else:
+            self._data = array(typecode, bytes(array(typecode).itemsize * size))
+
+    @classmethod
+    def from_buffer(cls, buffer, typecode: str) -> "StaticArray":
+        """
+        Create typed array that uses buffer as its storage without copying.
+        buffer is an array of the same typecode, or any other buffer such as
+        a memoryview of a memory map, whose bytes are machine values of
+        typecode. Changes to the array are made to the buffer itself.
+        Empty buffer or mismatched typecode raises StaticArrayException.
+        """
+        if isinstance(buffer, array):
+            if buffer.typecode != typecode:
+                raise StaticArrayException('Buffer has another typecode')
+            data = buffer
+        else:
+            data = memoryview(buffer).cast('B').cast(typecode)
+        if len(data) < 1:
+            raise StaticArrayException('Array size must be a positive integer')
+        arr = cls.__new__(cls)
+        arr._size = len(data)
+        arr._typecode = typecode
+        arr._data = data
+        return arr
 
     def __iter__(self) -> None:
         """
@@ -60,7 +98,10 @@ class StaticArray:
 
     def __str__(self) -> str:
         """Override string method to provide more readable output."""
-        return f"STAT_ARR Size: {self._size} {self._data}"
+        data = self._data
+        if isinstance(data, memoryview):
+            data = array(self._typecode, data)
+        return f"STAT_ARR Size: {self._size} {data}"
 
     def get(self, index: int):
         """
@@ -92,6 +133,70 @@ class StaticArray:
         """Return length of the array (number of elements)."""
         return self._size
 
+    def get_typecode(self) -> str:
+        """Return the array module typecode of the array, or None."""
+        return self._typecode
+
+    def get_buffer(self) -> memoryview:
+        """
+        Return a writable memoryview of the elements of a typed array.
+        Untyped arrays raise StaticArrayException.
+        """
+        if self._typecode is None:
+            raise StaticArrayException('Array has no typecode')
+        return memoryview(self._data)
+
+    def copy_from(self, source: "StaticArray", source_index: int,
+                  index: int, count: int) -> None:
+        """
+        Copy count elements starting at source_index of source array
+        to this array starting at index, as a single block copy.
+        Source and destination ranges may overlap.
+        Invalid ranges raise StaticArrayException.
+        """
+        if (count < 0 or source_index < 0 or index < 0 or
+                source_index + count > source.length() or
+                index + count > self.length()):
+            raise StaticArrayException('Index out of bounds')
+        block = source._data[source_index:source_index + count]
+        if self._typecode is not None and \
+                source._typecode != self._typecode:
+            block = array(self._typecode, block)
+        elif isinstance(block, memoryview) != isinstance(self._data, memoryview) \
+                and self._typecode is not None:
+            # Arrays and memoryviews only accept slices of their own type.
+            block = array(self._typecode, block.tobytes()) \
+                if isinstance(block, memoryview) else memoryview(block)
+        self._data[index:index + count] = block
+
+    def set_range(self, index: int, values) -> None:
+        """
+        Store the values of a list or tuple starting at index,
+        as a single block copy.
+        Invalid range raises StaticArrayException.
+        """
+        if index < 0 or index + len(values) > self.length():
+            raise StaticArrayException('Index out of bounds')
+        if self._typecode is None:
+            self._data[index:index + len(values)] = values
+        else:
+            block = array(self._typecode, values)
+            if isinstance(self._data, memoryview):
+                block = memoryview(block)
+            self._data[index:index + len(values)] = block
+
+    def get_range(self, index: int, count: int):
+        """
+        Return a copy of count elements starting at index, as a list for
+        untyped arrays or an array module array for typed arrays.
+        Invalid range raises StaticArrayException.
+        """
+        if count < 0 or index < 0 or index + count > self.length():
+            raise StaticArrayException('Index out of bounds')
+        block = self._data[index:index + count]
+        return array(self._typecode, block.tobytes()) \
+            if isinstance(block, memoryview) else block
+
 
 if __name__ == "__main__":
 
@@ -133,3 +238,19 @@ if __name__ == "__main__":
 
     print(type(arr))
     print(type(forbidden_list))
+
+    # Typed arrays store numbers as machine values
+    arr = StaticArray(5, 'd')
+    arr[0] = 2.5
+    print(arr[0], arr[1], arr.get_typecode())
+
+    # from_buffer() shares the storage of an existing buffer
+    values = array('q', [4, 5, 6])
+    arr = StaticArray.from_buffer(memoryview(values), 'q')
+    arr[0] = 40
+    print(values[0], arr.length())
+
+    # set_range() stores several values at once
+    arr = StaticArray(5)
+    arr.set_range(1, [10, 20, 30])
+    print(arr, arr.get_range(1, 2))
@@ -0,0 +1,181 @@
+# Description: This file contains streaming top-k selection built on the MinHeap percolation helpers. TopK keeps the
+# k smallest (or largest) values seen so far in a bounded heap whose root is the worst value kept, so a value that does
+# not qualify is rejected with a single comparison against the root. Values can be fed one at a time or in chunks, for
+# example from a generator, and memory stays O(k) regardless of the length of the stream. nsmallest() and nlargest()
+# select from a whole iterable.
+
+from min_heap import *
+from min_heap import _percolate_down
+
+
+class TopK:
+    """
+    Bounded accumulator of the k smallest values of a stream, or of the k largest values if largest is True. If key
+    is provided, values are ordered by key(value), which is called exactly once per value fed.
+    """
+
+    def __init__(self, k: int, key=None, largest: bool = False) -> None:
+        """
+        Initialize a new empty TopK accumulator. Raises MinHeapException if k is negative.
+        """
+        if k < 0:
+            raise MinHeapException
+        self._k = k
+        self._key = key
+        self._largest = largest
+        self._values = DynamicArray()
+        # Parallel array of priority values, or the same DynamicArray as _values without a key function.
+        self._keys = self._values if key is None else DynamicArray()
+
+    def __str__(self) -> str:
+        """
+        Return TopK content in human-readable form
+        """
+        return "TOPK " + str([value for value in self.result()])
+
+    def push(self, value: object) -> bool:
+        """
+        This method feeds one value to the TopK accumulator and returns True if it is kept, else returns False. Once k
+        values are kept, a value that does not beat the root costs a single comparison.
+
+        Input: object
+
+        Output: Boolean
+        """
+        key = value if self._key is None else self._key(value)
+        size = self._values.length()
+
+        # Fills the heap up to k values, then turns it into a heap whose root is the worst value kept.
+        if size < self._k:
+            self._values.append(value)
+            if self._keys is not self._values:
+                self._keys.append(key)
+            if size + 1 == self._k:
+                for i in range((self._k - 2) // 2, -1, -1):
+                    _percolate_down(self._values, i, self._k, 2, self._separate_keys(), not self._largest)
+            return True
+
+        if self._k == 0:
+            return False
+        root_key = self._keys[0]
+        if not (root_key < key if self._largest else key < root_key):
+            return False
+
+        self._values[0] = value
+        if self._keys is not self._values:
+            self._keys[0] = key
+        _percolate_down(self._values, 0, self._k, 2, self._separate_keys(), not self._largest)
+        return True
+
+    def extend(self, values) -> None:
+        """
+        This method feeds every value of an input iterable, such as a chunk of a stream or a generator, to the TopK
+        accumulator.
+
+        Input: iterable of objects
+
+        Output: None
+        """
+        for value in values:
+            self.push(value)
+
+    def size(self) -> int:
+        """
+        This method returns the number of values kept, which is at most k.
+
+        Input: None
+
+        Output: int
+        """
+        return self._values.length()
+
+    def result(self) -> DynamicArray:
+        """
+        This method returns the values kept as a new DynamicArray, in non-descending order for the k smallest values
+        or in non-ascending order for the k largest values. The accumulator is unchanged and can keep being fed.
+
+        Input: None
+
+        Output: DynamicArray
+        """
+        size = self._values.length()
+        values = DynamicArray()
+        keys = None if self._keys is self._values else DynamicArray()
+        for i in range(size):
+            values.append(self._values[i])
+            if keys is not None:
+                keys.append(self._keys[i])
+
+        # A partial heap that never reached k values is heapified first.
+        if size < self._k:
+            for i in range((size - 2) // 2, -1, -1):
+                _percolate_down(values, i, size, 2, keys, not self._largest)
+
+        # Moves the root, the worst value kept, behind the shrinking heap until the heap is empty.
+        for i in range(size - 1, 0, -1):
+            temp = values[i]
+            values[i] = values[0]
+            values[0] = temp
+            if keys is not None:
+                temp = keys[i]
+                keys[i] = keys[0]
+                keys[0] = temp
+            _percolate_down(values, 0, i, 2, keys, not self._largest)
+        return values
+
+    def _separate_keys(self) -> DynamicArray:
+        """
+        This helper method returns the DynamicArray of priority values, or None if the values are their own priority
+        values.
+
+        Input: None
+
+        Output: DynamicArray
+        """
+        return None if self._keys is self._values else self._keys
+
+
+def nsmallest(k: int, iterable, key=None) -> DynamicArray:
+    """
+    This function returns the k smallest values of an input iterable in non-descending order as a new DynamicArray,
+    using O(k) memory. If key is provided, values are ordered by key(value). Raises MinHeapException if k is negative.
+
+    Input: k int, iterable of objects, key function
+
+    Output: DynamicArray
+    """
+    top = TopK(k, key)
+    top.extend(iterable)
+    return top.result()
+
+
+def nlargest(k: int, iterable, key=None) -> DynamicArray:
+    """
+    This function returns the k largest values of an input iterable in non-ascending order as a new DynamicArray,
+    using O(k) memory. If key is provided, values are ordered by key(value). Raises MinHeapException if k is negative.
+
+    Input: k int, iterable of objects, key function
+
+    Output: DynamicArray
+    """
+    top = TopK(k, key, largest=True)
+    top.extend(iterable)
+    return top.result()
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    print("\n# nsmallest / nlargest example 1")
+    values = [100, 20, 6, 200, 90, 150, 300, 6, 45]
+    print(nsmallest(3, values))
+    print(nlargest(3, values))
+    print(nsmallest(2, ['monkey', 'zebra', 'elephant', 'horse', 'bear'], key=len))
+
+    print("\n# TopK example 1")
+    top = TopK(4)
+    for chunk in (range(1000, 900, -1), (x * 7 % 1000 for x in range(500))):
+        top.extend(chunk)
+        print(top, top.size())